@@ -3,8 +3,21 @@ from dataclasses import dataclass
 import json
 from pathlib import Path
 import os
-import re
+import string
 import sys
+from typing import Any
+
+try:
+    from eval import json_utils
+except ImportError:
+    # Run as a script (python3 eval/config.py), where eval/ itself is on sys.path
+    import json_utils
+
+# Characters allowed in a snapshot user_id
+_USER_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+# Parsed JSON files keyed by (absolute path, mtime_ns, size)
+_JSON_CACHE: dict[tuple, Any] = {}
 
 
 @dataclass
@@ -20,11 +33,24 @@ class GameConfig:
     p2_base_port: int = 7124
 
 
+def load_json_cached(path):
+    """Load a JSON file, reusing the parsed result until the file changes.
+
+    The returned object is shared between callers and must not be mutated.
+    """
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    data = _JSON_CACHE.get(key)
+    if data is None:
+        data = json_utils.loads(Path(path).read_bytes())
+        _JSON_CACHE[key] = data
+    return data
+
+
 def load_snake_config(path="snakes_config.json"):
     config_path = Path(path)
     try:
-        with open(config_path) as f:
-            config = json.load(f)
+        config = load_json_cached(config_path)
         snakes = config.get("snakes", [])
         if not snakes:
             raise ValueError(f"No snakes defined in {config_path}")
@@ -78,8 +104,7 @@ def main():
 
     elif args.type == "snapshot":
         try:
-            with open(args.config_file) as f:
-                config = json.load(f)
+            config = load_json_cached(args.config_file)
 
             # Check enabled
             if not config.get("enabled", False):
@@ -96,7 +121,7 @@ def main():
                 sys.exit(1)
 
             # Validate user_id format
-            if not re.match(r"^[a-zA-Z0-9_-]+$", user_id):
+            if not _USER_ID_CHARS.issuperset(user_id):
                 print(
                     f"ERROR: user_id '{user_id}' contains invalid characters", file=sys.stderr
                 )
@@ -1,23 +1,43 @@
 import os
+import stat
 import subprocess
 
+# Set once the CLI is known to be ready; failures are not remembered, so a later call retries
+_rules_cli_ready = False
+
 
 def check_and_build_rules_cli():
     """
     Check if Battlesnake rules CLI exists, build if necessary.
     Returns True if CLI is ready, False if build failed.
+    Success is cached for the lifetime of the process.
     """
+    global _rules_cli_ready
+    if not _rules_cli_ready:
+        _rules_cli_ready = _find_or_build_rules_cli()
+    return _rules_cli_ready
+
+
+def _find_or_build_rules_cli():
+    """Return True if the rules CLI binary exists or was just built"""
     cli_path = "rules/battlesnake"
 
-    # Check if binary exists and is executable
-    if os.path.exists(cli_path) and os.access(cli_path, os.X_OK):
-        print(f"[OK] Found Battlesnake CLI at {cli_path}")
-        return True
+    # Check if binary exists and is executable (one stat call)
+    try:
+        st = os.stat(cli_path)
+        if stat.S_ISREG(st.st_mode) and st.st_mode & 0o111:
+            print(f"[OK] Found Battlesnake CLI at {cli_path}")
+            return True
+    except FileNotFoundError:
+        pass
 
     print(f"Battlesnake CLI not found at {cli_path}")
 
-    # Check if we have the rules directory
-    if not os.path.exists("rules"):
+    # Check if we have the rules directory, listing it once
+    try:
+        with os.scandir("rules") as it:
+            entries = {entry.name: entry.is_dir() for entry in it}
+    except FileNotFoundError:
         print("[X] ERROR: 'rules' directory not found")
         print("  Please clone the Battlesnake rules repository:")
         print("  git clone https://github.com/BattlesnakeOfficial/rules.git")
@@ -27,9 +47,10 @@ def check_and_build_rules_cli():
     print("Attempting to build Battlesnake CLI...")
 
     # Check if it's a Go project (has go.mod or main.go)
-    if os.path.exists("rules/go.mod") or os.path.exists("rules/cli/main.go"):
-        return _build_go_cli()
-    elif os.path.exists("rules/Makefile"):
+    has_cli_dir = entries.get("cli", False)
+    if "go.mod" in entries or (has_cli_dir and os.path.exists("rules/cli/main.go")):
+        return _build_go_cli(has_cli_dir)
+    elif "Makefile" in entries:
         return _build_with_make()
     else:
         print("[X] ERROR: Don't know how to build the CLI")
@@ -37,7 +58,7 @@ def check_and_build_rules_cli():
         return False
 
 
-def _build_go_cli():
+def _build_go_cli(has_cli_dir):
     """Build CLI using Go"""
     print("Building with Go...")
 
@@ -49,7 +70,7 @@ def _build_go_cli():
         return False
 
     # Try building in rules/cli directory
-    build_dir = "rules/cli" if os.path.exists("rules/cli") else "rules"
+    build_dir = "rules/cli" if has_cli_dir else "rules"
 
     try:
         print(f"Running: go build in {build_dir}")
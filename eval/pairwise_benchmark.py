@@ -1,20 +1,36 @@
-from collections import defaultdict
-import subprocess
+import asyncio
 import os
 from eval.config import GameConfig
 import argparse
-import json
-import sympy
+import math
 import sys
 import logging
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from threading import Lock
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from tqdm import tqdm
 from eval.go_utils import check_and_build_rules_cli
+from eval import json_utils
+
+# Game outcome -> BenchmarkRunner.results counter
+RESULT_KEYS = {"draw": "draws", "p1": "p1_wins", "p2": "p2_wins"}
+
+# Number of finished games between progress bar stats updates
+POSTFIX_EVERY = 16
+
+BAR_FORMAT = "{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}] {postfix}"
+
+# Passed as the CLI's output file to stream game states over the stdout pipe
+STDOUT_PATH = "/dev/stdout"
 
 
 class BenchmarkRunner:
-    def __init__(self, iterations: int = 500, game_config: GameConfig = None, num_workers: int = 4):
+    def __init__(
+        self,
+        iterations: int = 500,
+        game_config: GameConfig = None,
+        num_workers: int = 4,
+        save_games: bool = True,
+    ):
         if not check_and_build_rules_cli():
             raise RuntimeError(
                 "Battlesnake CLI is not available and could not be built, please read the "
@@ -24,8 +40,8 @@ class BenchmarkRunner:
         self.iterations = iterations
         self.game_config = game_config
         self.num_workers = num_workers
-        self.results = defaultdict(int)
-        self.results_lock = Lock()
+        self.save_games = save_games
+        self.results = {"p1_wins": 0, "p2_wins": 0, "draws": 0}
         if len(game_config.round_robin) > 0:
             self.output_dir = (
                 f"tournaments/{game_config.round_robin}/"
@@ -33,15 +49,37 @@ class BenchmarkRunner:
             )
         else:
             self.output_dir = f"tournaments/{game_config.p1_name}_vs_{game_config.p2_name}"  # noqa: E501
-        os.makedirs(self.output_dir, exist_ok=True)
+        # Game logs and per-game error files go here; created once rather than per game
+        os.makedirs(f"{self.output_dir}/games", exist_ok=True)
 
         # Setup loggers
+        self._log_listeners = []
         self.summary_logger = self._setup_summary_logger()
         self.error_logger = self._setup_error_logger()
 
+    def _queue_file_handler(self, file_handler):
+        """Wrap a file handler so its disk writes happen on a QueueListener thread"""
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        self._log_listeners.append(listener)
+
+        handler = QueueHandler(log_queue)
+        handler.setLevel(file_handler.level)
+        return handler
+
+    def close(self):
+        """Flush queued log records to disk and stop the background log writers"""
+        for listener in self._log_listeners:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        self._log_listeners.clear()
+
     def _setup_summary_logger(self):
         """Configure logger for summary and progress messages"""
-        logger = logging.getLogger("BenchmarkRunner.Summary")
+        # Named per matchup so runners sharing an event loop don't steal each other's handlers
+        logger = logging.getLogger(f"BenchmarkRunner.Summary.{self.output_dir}")
         logger.setLevel(logging.INFO)
         logger.handlers.clear()
 
@@ -53,19 +91,19 @@ class BenchmarkRunner:
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
 
-        # Summary file handler
+        # Summary file handler (written from a background thread)
         summary_file = f"{self.output_dir}/summary.log"
         file_handler = logging.FileHandler(summary_file, mode="w")
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        logger.addHandler(self._queue_file_handler(file_handler))
 
         logger.propagate = False
         return logger
 
     def _setup_error_logger(self):
         """Configure logger for error and warning messages"""
-        logger = logging.getLogger("BenchmarkRunner.Error")
+        logger = logging.getLogger(f"BenchmarkRunner.Error.{self.output_dir}")
         logger.setLevel(logging.WARNING)
         logger.handlers.clear()
 
@@ -78,19 +116,65 @@ class BenchmarkRunner:
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
 
-        # Error file handler
+        # Error file handler (written from a background thread)
         error_file = f"{self.output_dir}/error.log"
         file_handler = logging.FileHandler(error_file, mode="w")
         file_handler.setLevel(logging.WARNING)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        logger.addHandler(self._queue_file_handler(file_handler))
 
         logger.propagate = False
         return logger
 
-    def run_multiple_games(self):
-        """Run multiple games in parallel with real-time progress tracking"""
-        # Print header
+    async def run_games(self, semaphore, pbar, show_postfix=True):
+        """Run every game as a CLI child process, at most one per semaphore slot at a time.
+
+        The semaphore may be shared with other runners on the same event loop, in which
+        case it bounds the total number of games in flight across all of them.
+        """
+
+        async def run_one(game_num, seed):
+            async with semaphore:
+                try:
+                    result = await run_single_game(
+                        game_num=game_num,
+                        seed=seed,
+                        output_dir=self.output_dir,
+                        game_config=self.game_config,
+                        save_game=self.save_games,
+                    )
+                except Exception as e:
+                    self.error_logger.error(f"Game {game_num} failed with exception: {e}")
+                    pbar.update(1)
+                    return
+
+            # Update results (every game finishes on the event loop thread, so no lock)
+            if result:
+                self.results[RESULT_KEYS[result]] += 1
+
+            # Update progress bar; refresh the stats postfix only every few games and
+            # let tqdm's own rate limiter decide when to redraw
+            pbar.update(1)
+            if show_postfix and (pbar.n % POSTFIX_EVERY == 0 or pbar.n == pbar.total):
+                pbar.set_postfix(
+                    {
+                        "P1": self.results["p1_wins"],
+                        "P2": self.results["p2_wins"],
+                        "Draws": self.results["draws"],
+                    },
+                    refresh=False,
+                )
+
+        # Seeds are consecutive primes above 100
+        game_params = enumerate(map(str, first_n_primes_after(self.iterations)))
+        await asyncio.gather(*(run_one(game_num, seed) for game_num, seed in game_params))
+
+    async def _run_games(self, pbar):
+        install_pidfd_child_watcher()
+        await self.run_games(asyncio.Semaphore(self.num_workers), pbar)
+
+    def log_header(self):
+        """Log the benchmark banner and game config"""
         self.summary_logger.info("\n" + "=" * 60)
         self.summary_logger.info("     BATTLESNAKE BENCHMARK RESULTS")
         self.summary_logger.info(
@@ -106,72 +190,8 @@ class BenchmarkRunner:
         self.summary_logger.info("         - Using external servers (Docker/manual)")
         self.summary_logger.info("=" * 60 + "\n")
 
-        # Generate all game parameters
-        game_params = []
-        last_prime = 100
-        for i in range(self.iterations):
-            next_prime = sympy.nextprime(last_prime)
-            game_params.append((i, str(next_prime)))
-            last_prime = next_prime
-
-        # Run games in parallel with tqdm progress bar
-        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
-
-            # Submit all games individually
-            future_to_game = {
-                executor.submit(
-                    run_single_game_worker,
-                    game_num=game_num,
-                    seed=seed,
-                    output_dir=self.output_dir,
-                    game_config=self.game_config,
-                ): (game_num, seed)
-                for idx, (game_num, seed) in enumerate(game_params)
-            }
-
-            # Process completed games with tqdm progress bar
-            bar_fmt = (
-                "{l_bar}{bar}| {n_fmt}/{total_fmt} "
-                "[{elapsed}<{remaining}, {rate_fmt}] {postfix}"
-            )
-            with tqdm(
-                total=self.iterations,
-                desc="Running games",
-                unit="game",
-                bar_format=bar_fmt,
-            ) as pbar:
-                for future in as_completed(future_to_game):
-                    game_num, seed = future_to_game[future]
-                    try:
-                        result = future.result()
-
-                        # Update results
-                        if result:
-                            with self.results_lock:
-                                if result == "draw":
-                                    self.results["draws"] += 1
-                                elif result == "p1":
-                                    self.results["p1_wins"] += 1
-                                elif result == "p2":
-                                    self.results["p2_wins"] += 1
-
-                        # Update progress bar with current stats
-                        pbar.set_postfix(
-                            {
-                                "P1": self.results["p1_wins"],
-                                "P2": self.results["p2_wins"],
-                                "Draws": self.results["draws"],
-                            },
-                            refresh=True,
-                        )
-                        pbar.update(1)
-
-                    except Exception as e:
-                        self.error_logger.error(f"Game {game_num} failed with exception: {e}")
-                        pbar.update(1)
-
-        # Print final summary
-        print()  # Newline after progress bar
+    def log_summary(self):
+        """Log the final win/draw counts and the overall winner"""
         self.summary_logger.info("=" * 60)
         self.summary_logger.info("     Summary:")
         self.summary_logger.info(f"         - Total Games: {self.iterations}")
@@ -190,16 +210,102 @@ class BenchmarkRunner:
         self.summary_logger.info(f"         - Final Winner: {winner}")
         self.summary_logger.info("=" * 60)
 
+    def run_multiple_games(self):
+        """Run multiple games in parallel with real-time progress tracking"""
+        self.log_header()
+
+        # Run games concurrently with tqdm progress bar
+        with tqdm(
+            total=self.iterations,
+            desc="Running games",
+            unit="game",
+            bar_format=BAR_FORMAT,
+            mininterval=0.2,
+            maxinterval=1.0,
+        ) as pbar:
+            asyncio.run(self._run_games(pbar))
 
-def run_single_game_worker(game_num, seed, output_dir, game_config):
+        print()  # Newline after progress bar
+        self.log_summary()
+
+
+def install_pidfd_child_watcher():
+    """Reap CLI children through pidfds polled by the running event loop.
+
+    Before Python 3.12 asyncio defaults to a ThreadedChildWatcher, which parks one
+    thread in waitpid() per child. On Linux 5.3+ a pidfd registered with the loop's
+    selector wakes it exactly when a child exits instead. Python 3.12+ already does this.
+    """
+    if sys.version_info >= (3, 12) or not hasattr(os, "pidfd_open"):
+        return
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        # Kernel without pidfd support
+        return
+    watcher = asyncio.PidfdChildWatcher()
+    watcher.attach_loop(asyncio.get_running_loop())
+    asyncio.set_child_watcher(watcher)
+
+
+def first_n_primes_after(n, start=100):
+    """Return the first n primes strictly greater than start using a sieve of Eratosthenes"""
+    if n <= 0:
+        return []
+    # Prime counting estimate with headroom; grown below if it falls short
+    limit = start + max(64, int(n * (math.log(n + start) + 2)))
+    while True:
+        sieve = bytearray([1]) * (limit + 1)
+        sieve[0:2] = b"\x00\x00"
+        for i in range(2, math.isqrt(limit) + 1):
+            if sieve[i]:
+                sieve[i * i :: i] = bytes(len(range(i * i, limit + 1, i)))
+        primes = [i for i in range(start + 1, limit + 1) if sieve[i]]
+        if len(primes) >= n:
+            return primes[:n]
+        limit *= 2
+
+
+def last_json_line(data):
+    """Return the last line of captured CLI output that holds a JSON object"""
+    end = len(data)
+    while end > 0:
+        start = data.rfind(b"\n", 0, end) + 1
+        line = data[start:end].strip()
+        if line.startswith(b"{"):
+            return line
+        end = start - 1
+    return b""
+
+
+def read_last_line(path, block_size=65536):
+    """Return the last non-empty line of a file as bytes, reading backwards from the end"""
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        n = min(size, block_size)
+        while True:
+            f.seek(size - n)
+            tail = f.read(n).rstrip(b"\r\n")
+            newline = tail.rfind(b"\n")
+            if newline != -1 or n == size:
+                return tail[newline + 1 :]
+            # No line break in the window yet, double it and retry
+            n = min(size, n * 2)
+
+
+async def run_single_game(game_num, seed, output_dir, game_config, save_game=True):
     """
     Run a single game using external snake servers (Docker or otherwise).
-    Assumes servers are already running at the configured ports.
+    Assumes servers are already running at the configured ports and that
+    {output_dir}/games exists (BenchmarkRunner creates it).
+
+    When save_game is False the game log is streamed to stdout and parsed in memory
+    instead of being written to games/game_{game_num}.json.
     """
     try:
         games_dir = f"{output_dir}/games"
-        os.makedirs(games_dir, exist_ok=True)
-        output_file = f"{games_dir}/game_{game_num}.json"
+        save_game = save_game or not os.path.exists(STDOUT_PATH)
+        output_file = f"{games_dir}/game_{game_num}.json" if save_game else STDOUT_PATH
 
         # Run the game against external servers
         cmd = [
@@ -225,26 +331,29 @@ def run_single_game_worker(game_num, seed, output_dir, game_config):
             "10000",
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await proc.communicate()
+        stderr = stderr.decode(errors="replace")
 
         # Check for errors
-        if result.returncode != 0:
+        if proc.returncode != 0:
             # Determine which snake failed and award win to opponent
-            stderr = result.stderr.lower()
-
-            # Check if error mentions either snake's port
+            # Check if the last error line mentions either snake's port (digits, so no
+            # case folding needed)
             p1_port_str = str(game_config.p1_base_port)
             p2_port_str = str(game_config.p2_base_port)
-            stderr_lines = stderr.split("\n")
+            last_line = stderr.rpartition("\n")[2]
 
-            if p1_port_str in stderr_lines[-1]:
+            if p1_port_str in last_line:
                 # Player 1 failed, player 2 wins
                 print(
                     f"Game {game_num}: {game_config.p1_name} failed/timed out, "
                     f"awarding win to {game_config.p2_name}"
                 )
                 return "p2"
-            elif p2_port_str in stderr_lines[-1]:
+            elif p2_port_str in last_line:
                 # Player 2 failed, player 1 wins
                 print(
                     f"Game {game_num}: {game_config.p2_name} failed/timed out, "
@@ -259,31 +368,33 @@ def run_single_game_worker(game_num, seed, output_dir, game_config):
                 return None
 
         # Parse result from successful game
-        if os.path.exists(output_file):
-            with open(output_file, "r") as f:
-                lines = f.readlines()
-                if not lines:
-                    # Empty file - treat as unknown error
-                    with open(f"{games_dir}/game_{game_num}_error.txt", "w") as f:
-                        f.write("Output file is empty\n")
-                    return None
-
-                final_state = json.loads(lines[-1])
-
-                if final_state["isDraw"]:
-                    return "draw"
-                elif final_state.get("winnerName") == game_config.p1_name:
-                    return "p1"
-                elif final_state.get("winnerName") == game_config.p2_name:
-                    return "p2"
+        if save_game:
+            if not os.path.exists(output_file):
+                # Output file doesn't exist - unknown error
+                with open(f"{games_dir}/game_{game_num}_error.txt", "w") as f:
+                    f.write("Output file not created\n")
+                    f.write(f"STDOUT:\n{stdout.decode(errors='replace')}\n")
+                    f.write(f"STDERR:\n{stderr}\n")
+                return None
+            last_line = read_last_line(output_file)
         else:
-            # Output file doesn't exist - unknown error
+            last_line = last_json_line(stdout)
+
+        if not last_line:
+            # Empty output - treat as unknown error
             with open(f"{games_dir}/game_{game_num}_error.txt", "w") as f:
-                f.write("Output file not created\n")
-                f.write(f"STDOUT:\n{result.stdout}\n")
-                f.write(f"STDERR:\n{result.stderr}\n")
+                f.write("Output file is empty\n" if save_game else "No game state on stdout\n")
             return None
 
+        final_state = json_utils.loads(last_line)
+
+        if final_state["isDraw"]:
+            return "draw"
+        elif final_state.get("winnerName") == game_config.p1_name:
+            return "p1"
+        elif final_state.get("winnerName") == game_config.p2_name:
+            return "p2"
+
         return None
 
     except Exception as e:
@@ -302,6 +413,11 @@ def main():
     parser.add_argument("--workers", type=int, default=8, help="Number of parallel workers")
     parser.add_argument("--port_1", type=int, default=7123, help="Port for the first snake")
     parser.add_argument("--port_2", type=int, default=7124, help="Port for the second snake")
+    parser.add_argument(
+        "--no-save-games",
+        action="store_true",
+        help="Only record results; don't write per-game JSON logs (disables replay viewing)",
+    )
     args = parser.parse_args()
 
     game_config = GameConfig(
@@ -309,9 +425,15 @@ def main():
         p2_base_port=args.port_2,
     )
     benchmark_runner = BenchmarkRunner(
-        iterations=args.iterations, game_config=game_config, num_workers=args.workers
+        iterations=args.iterations,
+        game_config=game_config,
+        num_workers=args.workers,
+        save_games=not args.no_save_games,
     )
-    benchmark_runner.run_multiple_games()
+    try:
+        benchmark_runner.run_multiple_games()
+    finally:
+        benchmark_runner.close()
 
 
 if __name__ == "__main__":
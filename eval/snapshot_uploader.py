@@ -4,11 +4,60 @@ import os
 import json
 import tarfile
 import hashlib
+import shutil
+import subprocess
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 from datetime import datetime
 import tempfile
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from eval.config import load_json_cached
+from eval import json_utils
+
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+# Source trees are small; level 1 costs far less CPU for a near-identical size
+TAR_COMPRESSLEVEL = 1
+UPLOAD_CHUNK_SIZE = 4 << 20  # 4 MiB
+_hash_buffers = threading.local()
+
+
+# Directories and file types left out of snapshot tarballs
+SNAPSHOT_EXCLUDE_DIRS = frozenset({".git", "__pycache__", ".venv", "venv", "node_modules"})
+SNAPSHOT_EXCLUDE_SUFFIXES = (".pyc", ".pyo", ".log")
+
+
+def _snapshot_filter(tarinfo):
+    """tarfile filter that drops VCS, cache and virtualenv trees and build artifacts"""
+    name = tarinfo.name.rpartition("/")[2]
+    if tarinfo.isdir() and name in SNAPSHOT_EXCLUDE_DIRS:
+        # Returning None for a directory also skips everything below it
+        return None
+    if name.endswith(SNAPSHOT_EXCLUDE_SUFFIXES):
+        return None
+    return tarinfo
+
+
+class _LargeChunkReader:
+    """File wrapper for upload bodies that reads in large chunks.
+
+    urllib3 reads request bodies in small fixed blocks (8-16 KiB); returning
+    UPLOAD_CHUNK_SIZE per read() cuts the number of Python-level reads and
+    socket writes. __len__ lets requests send Content-Length instead of
+    falling back to chunked transfer encoding.
+    """
+
+    def __init__(self, f, size):
+        self._f = f
+        self._size = size
+
+    def __len__(self):
+        return self._size
+
+    def read(self, _size=-1):
+        return self._f.read(UPLOAD_CHUNK_SIZE)
 
 
 class SnapshotUploader:
@@ -17,6 +66,9 @@ class SnapshotUploader:
     def __init__(self, config):
         self.user_id = config["user_id"]
         self.config = config
+        # Reuse one connection pool so the tarball and metadata PUTs share a TLS session
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
         # Load counter from file, or start at 0
         self._counter_file = Path(".tournament_slot_counter")
         if self._counter_file.exists():
@@ -44,8 +96,7 @@ class SnapshotUploader:
 
         print(f"Creating snapshot: {tarball_name}")
 
-        with tarfile.open(tarball_path, "w:gz") as tar:
-            tar.add(source_path, arcname=source_path.name)
+        self._write_tarball(source_path, tarball_path)
 
         # Create metadata
         is_tournament = identifier.startswith("round_robin_")
@@ -63,11 +114,32 @@ class SnapshotUploader:
         metadata_name = f"{self.user_id}_{identifier}_{timestamp}.json"
         metadata_path = temp_dir / metadata_name
 
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        with open(metadata_path, "wb") as f:
+            f.write(json_utils.dumps_pretty(metadata))
 
         return tarball_path, metadata_path
 
+    def _write_tarball(self, source_path, tarball_path):
+        """Write a gzipped tarball, using parallel pigz when it is installed"""
+        pigz = shutil.which("pigz")
+        if pigz is None:
+            with tarfile.open(tarball_path, "w:gz", compresslevel=TAR_COMPRESSLEVEL) as tar:
+                tar.add(source_path, arcname=source_path.name, filter=_snapshot_filter)
+            return
+
+        # Stream an uncompressed tar into pigz, which deflates across all cores
+        cmd = [pigz, f"-{TAR_COMPRESSLEVEL}", "-p", str(os.cpu_count() or 1)]
+        with open(tarball_path, "wb") as out:
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=out)
+            try:
+                with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                    tar.add(source_path, arcname=source_path.name, filter=_snapshot_filter)
+            finally:
+                proc.stdin.close()
+                returncode = proc.wait()
+        if returncode != 0:
+            raise RuntimeError(f"pigz exited with status {returncode}")
+
     def upload(self, tarball_path, metadata_path, identifier):
         """Upload using pre-generated signed URLs
 
@@ -103,8 +175,11 @@ class SnapshotUploader:
             # Upload tarball
             print(f"Uploading code ({tarball_path.stat().st_size / 1024:.1f} KB)...")
             with open(tarball_path, "rb") as f:
-                response = requests.put(
-                    tarball_url, data=f, headers={"Content-Type": "application/gzip"}, timeout=300
+                response = self._session.put(
+                    tarball_url,
+                    data=_LargeChunkReader(f, tarball_path.stat().st_size),
+                    headers={"Content-Type": "application/gzip"},
+                    timeout=300,
                 )
                 response.raise_for_status()
 
@@ -113,7 +188,7 @@ class SnapshotUploader:
             # Upload metadata
             print("Uploading metadata...")
             with open(metadata_path, "rb") as f:
-                response = requests.put(
+                response = self._session.put(
                     metadata_url, data=f, headers={"Content-Type": "application/json"}, timeout=60
                 )
                 response.raise_for_status()
@@ -154,15 +229,51 @@ class SnapshotUploader:
             return {"status": "failed", "error": str(e)}
 
     def _calculate_hash(self, directory):
-        hash_obj = hashlib.sha256()
-        for file_path in sorted(Path(directory).rglob("*")):
-            if file_path.is_file() and not file_path.name.startswith("."):
-                hash_obj.update(file_path.name.encode())
-                with open(file_path, "rb") as f:
-                    hash_obj.update(f.read())
+        # Sort by path components, matching the order of sorted Path objects
+        entries = sorted(_walk_files(os.fspath(directory)), key=lambda e: e.path.split(os.sep))
+        # hashlib releases the GIL while hashing, so per-file digests run in parallel
+        max_workers = min(32, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            digests = executor.map(_hash_file, [entry.path for entry in entries])
+
+            # Combine in sorted order so the result is deterministic
+            hash_obj = hashlib.blake2b()
+            for entry, digest in zip(entries, digests):
+                hash_obj.update(entry.name.encode())
+                hash_obj.update(digest)
         return hash_obj.hexdigest()
 
 
+def _walk_files(root):
+    """Yield a DirEntry for every file under root, skipping hidden files and directories.
+
+    DirEntry caches the file type from the directory listing, so this needs no
+    extra stat call per entry.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
+def _hash_file(file_path):
+    """Return the BLAKE2b digest of a file, streamed through a per-thread buffer"""
+    buf = getattr(_hash_buffers, "buf", None)
+    if buf is None:
+        buf = _hash_buffers.buf = memoryview(bytearray(HASH_CHUNK_SIZE))
+    hash_obj = hashlib.blake2b()
+    with open(file_path, "rb") as f:
+        while n := f.readinto(buf):
+            hash_obj.update(buf[:n])
+    return hash_obj.digest()
+
+
 def main():
     """CLI interface"""
     import argparse
@@ -182,8 +293,7 @@ def main():
     identifier = args.stage if args.stage else args.tournament_id
 
     # Load config
-    with open(args.config) as f:
-        config = json.load(f)
+    config = load_json_cached(args.config)
 
     # Load results
     results_data = None
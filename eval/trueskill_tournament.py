@@ -3,14 +3,23 @@ Run a round-robin tournament between multiple snakes and compute TrueSkill ratin
 """
 
 import argparse
-import json
+import asyncio
+import math
 import os
 import random
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from trueskill import Rating, rate_1vs1, global_env
+from tqdm import tqdm
+from trueskill import Rating, calc_draw_margin, global_env
+from eval import json_utils
 from eval.config import GameConfig
-from eval.pairwise_benchmark import BenchmarkRunner
+from eval.pairwise_benchmark import BAR_FORMAT, BenchmarkRunner, install_pidfd_child_watcher, read_last_line
+
+# Ratings are never mutated in place, so every snake can start from the same default
+_DEFAULT_RATING = Rating()
 
 
 class TrueSkillTournament:
@@ -24,7 +33,7 @@ class TrueSkillTournament:
         self.snakes = snakes
         self.iterations = iterations
         self.workers = workers
-        self.ratings = {snake["name"]: Rating() for snake in snakes}
+        self.ratings = dict.fromkeys((snake["name"] for snake in snakes), _DEFAULT_RATING)
         self.matchup_results = {}
         if tournament_id:
             self.round_robin = tournament_id
@@ -52,36 +61,56 @@ class TrueSkillTournament:
 
         print(f"Running {len(matchups)} matchups...\n")
 
-        # Run each matchup
-        for idx, (snake1, snake2) in enumerate(matchups, 1):
-            print(f"\n{'='*70}")
-            print(f"Matchup {idx}/{len(matchups)}: {snake1['name']} vs {snake2['name']}")
-            print(f"{'='*70}")
-
-            # Create game config
-            game_config = GameConfig(
-                round_robin=self.round_robin,
-                p1_name=snake1["name"],
-                p1_base_port=snake1["port"],
-                p2_name=snake2["name"],
-                p2_base_port=snake2["port"],
-            )
-
-            # Run benchmark
-            benchmark = BenchmarkRunner(
-                iterations=self.iterations, game_config=game_config, num_workers=self.workers
-            )
-            benchmark.run_multiple_games()
-
-            # Store results
-            matchup_key = f"{snake1['name']}_vs_{snake2['name']}"
-            self.matchup_results[matchup_key] = {
-                "snake1": snake1["name"],
-                "snake2": snake2["name"],
-                "snake1_wins": benchmark.results["p1_wins"],
-                "snake2_wins": benchmark.results["p2_wins"],
-                "draws": benchmark.results["draws"],
-            }
+        # One runner per matchup; all of them share a single pool of worker slots so
+        # matchups run concurrently and no slot idles while a matchup drains its last games
+        runners = []
+        try:
+            for idx, (snake1, snake2) in enumerate(matchups, 1):
+                print(f"\n{'='*70}")
+                print(f"Matchup {idx}/{len(matchups)}: {snake1['name']} vs {snake2['name']}")
+                print(f"{'='*70}")
+
+                # Create game config
+                game_config = GameConfig(
+                    round_robin=self.round_robin,
+                    p1_name=snake1["name"],
+                    p1_base_port=snake1["port"],
+                    p2_name=snake2["name"],
+                    p2_base_port=snake2["port"],
+                )
+                benchmark = BenchmarkRunner(
+                    iterations=self.iterations, game_config=game_config, num_workers=self.workers
+                )
+                runners.append(benchmark)
+                benchmark.log_header()
+
+            with tqdm(
+                total=self.iterations * len(runners),
+                desc="Running games",
+                unit="game",
+                bar_format=BAR_FORMAT,
+                mininterval=0.2,
+                maxinterval=1.0,
+            ) as pbar:
+                asyncio.run(self._run_matchups(runners, pbar))
+            print()  # Newline after progress bar
+
+            for benchmark in runners:
+                benchmark.log_summary()
+
+                # Store results
+                config = benchmark.game_config
+                matchup_key = f"{config.p1_name}_vs_{config.p2_name}"
+                self.matchup_results[matchup_key] = {
+                    "snake1": config.p1_name,
+                    "snake2": config.p2_name,
+                    "snake1_wins": benchmark.results["p1_wins"],
+                    "snake2_wins": benchmark.results["p2_wins"],
+                    "draws": benchmark.results["draws"],
+                }
+        finally:
+            for benchmark in runners:
+                benchmark.close()
 
         # Calculate TrueSkill ratings from all games
         self._calculate_trueskill_from_games()
@@ -89,17 +118,20 @@ class TrueSkillTournament:
         # Print final rankings
         self._print_final_rankings()
 
+    async def _run_matchups(self, runners, pbar):
+        """Run the games of every matchup on one event loop, at most self.workers at a time"""
+        install_pidfd_child_watcher()
+        semaphore = asyncio.Semaphore(self.workers)
+        await asyncio.gather(*(benchmark.run_games(semaphore, pbar, show_postfix=False) for benchmark in runners))
+
     def _calculate_trueskill_from_games(self):
         """Calculate TrueSkill ratings by processing individual games in sequence"""
         print("\n" + "=" * 70)
         print("     CALCULATING TRUESKILL RATINGS FROM GAME SEQUENCE")
         print("=" * 70 + "\n")
 
-        # Reset ratings
-        self.ratings = {snake["name"]: Rating() for snake in self.snakes}
-
-        # Collect all game results from all matchups
-        all_games = []
+        # Collect all game files from all matchups
+        game_jobs = []
         tournament_dir = Path(self.output_dir)
 
         for matchup_dir in tournament_dir.iterdir():
@@ -110,90 +142,58 @@ class TrueSkillTournament:
                     matchup_name = matchup_dir.name
                     if "_vs_" in matchup_name:
                         snake1_name, snake2_name = matchup_name.split("_vs_")
+                        for game_file in games_dir.glob("game_*.json"):
+                            game_jobs.append((game_file, snake1_name, snake2_name))
+
+        # Ratings live in flat per-snake lists of mu and sigma^2 while updating
+        env = global_env()
+        names = [snake["name"] for snake in self.snakes]
+        index = {name: i for i, name in enumerate(names)}
+        mu = [env.mu] * len(names)
+        sigma2 = [env.sigma**2] * len(names)
+        draw_margin = calc_draw_margin(env.draw_probability, 2, env)
+
+        # Read and parse the game files concurrently (I/O bound), reducing each game to a
+        # (winner index, loser index, drawn) rating event counted per matchup outcome
+        outcome_counts = Counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for (game_file, snake1_name, snake2_name), (winner, error) in zip(
+                game_jobs, executor.map(_parse_game_job, game_jobs)
+            ):
+                if error is not None:
+                    print(f"Warning: Could not parse {game_file}: {error}")
+                    continue
+                i, j = index[snake1_name], index[snake2_name]
+                if winner == snake1_name:
+                    outcome_counts[(i, j, False)] += 1
+                elif winner == snake2_name:
+                    outcome_counts[(j, i, False)] += 1
+                elif winner == "draw":
+                    outcome_counts[(i, j, True)] += 1
+                else:
+                    # Unknown result, still counted as a game but not rated
+                    outcome_counts[None] += 1
 
-                        # Read all game files
-                        for game_file in sorted(games_dir.glob("game_*.json")):
-                            try:
-                                winner = self._parse_game_winner(
-                                    game_file, snake1_name, snake2_name
-                                )
-                                all_games.append(
-                                    {
-                                        "snake1": snake1_name,
-                                        "snake2": snake2_name,
-                                        "winner": winner,
-                                        "file": str(game_file),
-                                    }
-                                )
-                            except Exception as e:
-                                print(f"Warning: Could not parse {game_file}: {e}")
-
-        print(f"Found {len(all_games)} total games across all matchups")
-
-        # Shuffle games to avoid order bias
+        print(f"Found {sum(outcome_counts.values())} total games across all matchups")
+        outcome_counts.pop(None, None)
+
+        # Expand the counts in a fixed order, then shuffle to avoid order bias
         # Use a fixed seed for reproducibility
+        events = []
+        for event in sorted(outcome_counts):
+            events.extend([event] * outcome_counts[event])
         random.seed(42)
-        random.shuffle(all_games)
+        random.shuffle(events)
 
         print("Processing games in randomized order to calculate TrueSkill...")
 
         # Update TrueSkill for each game in sequence
-        for game in all_games:
-            snake1 = game["snake1"]
-            snake2 = game["snake2"]
-            winner = game["winner"]
-
-            if winner == snake1:
-                # Snake1 wins
-                self.ratings[snake1], self.ratings[snake2] = rate_1vs1(
-                    self.ratings[snake1], self.ratings[snake2]
-                )
-            elif winner == snake2:
-                # Snake2 wins
-                self.ratings[snake2], self.ratings[snake1] = rate_1vs1(
-                    self.ratings[snake2], self.ratings[snake1]
-                )
-            elif winner == "draw":
-                # Draw
-                self.ratings[snake1], self.ratings[snake2] = rate_1vs1(
-                    self.ratings[snake1], self.ratings[snake2], drawn=True
-                )
+        for winner, loser, drawn in events:
+            _rate_1vs1(mu, sigma2, winner, loser, drawn, env, draw_margin)
 
-        print("[OK] TrueSkill ratings calculated\n")
+        self.ratings = {name: Rating(mu[i], math.sqrt(sigma2[i])) for i, name in enumerate(names)}
 
-    def _parse_game_winner(self, game_file, snake1_name, snake2_name):
-        """Parse a game file to determine the winner"""
-        with open(game_file, "r") as f:
-            lines = f.readlines()
-            if not lines:
-                return None
-
-            # Parse the last line (final state)
-            final_state = json.loads(lines[-1])
-
-            # Check if it's a draw
-            if final_state.get("isDraw", False):
-                return "draw"
-
-            # Get winner name
-            winner_name = final_state.get("winnerName")
-
-            if winner_name == snake1_name:
-                return snake1_name
-            elif winner_name == snake2_name:
-                return snake2_name
-            else:
-                # Check which snakes are still alive
-                snakes = final_state.get("board", {}).get("snakes", [])
-                alive_snakes = [s for s in snakes if s.get("health", 0) > 0]
-
-                if len(alive_snakes) == 1:
-                    return alive_snakes[0].get("name")
-                elif len(alive_snakes) == 0:
-                    return "draw"
-                else:
-                    # Multiple survivors = draw
-                    return "draw"
+        print("[OK] TrueSkill ratings calculated\n")
 
     def _print_final_rankings(self):
         """Print final TrueSkill rankings and save to file"""
@@ -201,15 +201,18 @@ class TrueSkillTournament:
         print("     FINAL TRUESKILL RANKINGS")
         print("=" * 70 + "\n")
 
-        # Sort by TrueSkill rating (mu - 3*sigma for conservative estimate)
-        ranked = sorted(self.ratings.items(), key=lambda x: x[1].mu - 3 * x[1].sigma, reverse=True)
+        # Sort by TrueSkill rating (mu - 3*sigma for conservative estimate), computed once per snake
+        ranked = [
+            (snake_name, rating.mu, rating.sigma, rating.mu - 3 * rating.sigma)
+            for snake_name, rating in self.ratings.items()
+        ]
+        ranked.sort(key=itemgetter(3), reverse=True)
 
         results = []
-        for rank, (snake_name, rating) in enumerate(ranked, 1):
-            conservative_skill = rating.mu - 3 * rating.sigma
+        for rank, (snake_name, mu, sigma, conservative_skill) in enumerate(ranked, 1):
             print(f"{rank}. {snake_name}")
-            print(f"   mu (mean): {rating.mu:.2f}")
-            print(f"   sigma (uncertainty): {rating.sigma:.2f}")
+            print(f"   mu (mean): {mu:.2f}")
+            print(f"   sigma (uncertainty): {sigma:.2f}")
             print(f"   Conservative skill: {conservative_skill:.2f}")
             print()
 
@@ -217,8 +220,8 @@ class TrueSkillTournament:
                 {
                     "rank": rank,
                     "name": snake_name,
-                    "mu": rating.mu,
-                    "sigma": rating.sigma,
+                    "mu": mu,
+                    "sigma": sigma,
                     "conservative_skill": conservative_skill,
                 }
             )
@@ -236,13 +239,83 @@ class TrueSkillTournament:
         }
 
         output_file = f"{self.output_dir}/trueskill_results.json"
-        with open(output_file, "w") as f:
-            json.dump(output, f, indent=2)
+        with open(output_file, "wb") as f:
+            f.write(json_utils.dumps_pretty(output))
 
         print(f"Results saved to: {output_file}")
         print("=" * 70 + "\n")
 
 
+def parse_game_winner(game_file, snake1_name, snake2_name):
+    """Parse a game file to determine the winner"""
+    # Only the last line (final state) matters, so read just the tail of the file
+    last_line = read_last_line(game_file, block_size=8192)
+    if not last_line:
+        return None
+
+    final_state = json_utils.loads(last_line)
+
+    # Check if it's a draw
+    if final_state.get("isDraw", False):
+        return "draw"
+
+    # Get winner name
+    winner_name = final_state.get("winnerName")
+
+    if winner_name == snake1_name:
+        return snake1_name
+    elif winner_name == snake2_name:
+        return snake2_name
+    else:
+        # Check which snakes are still alive
+        snakes = final_state.get("board", {}).get("snakes", [])
+        alive_snakes = [s for s in snakes if s.get("health", 0) > 0]
+
+        if len(alive_snakes) == 1:
+            return alive_snakes[0].get("name")
+        elif len(alive_snakes) == 0:
+            return "draw"
+        else:
+            # Multiple survivors = draw
+            return "draw"
+
+
+def _parse_game_job(job):
+    """Parse one (game_file, snake1_name, snake2_name) job, returning (winner, error)"""
+    try:
+        return parse_game_winner(*job), None
+    except Exception as e:
+        return None, e
+
+
+def _rate_1vs1(mu, sigma2, winner, loser, drawn, env, draw_margin):
+    """Apply one 1vs1 TrueSkill update in place on per-player mu / sigma^2 lists.
+
+    Equivalent to trueskill.rate_1vs1 (a two-player factor graph converges in one
+    pass), but computed in closed form without building Rating objects or a graph.
+    When drawn is True the winner/loser order doesn't matter. draw_margin is
+    calc_draw_margin(env.draw_probability, 2, env), passed in so it is computed once.
+    """
+    winner_var = sigma2[winner] + env.tau**2
+    loser_var = sigma2[loser] + env.tau**2
+    c2 = 2 * env.beta**2 + winner_var + loser_var
+    c = math.sqrt(c2)
+    diff = (mu[winner] - mu[loser]) / c
+    margin = draw_margin / c
+
+    if drawn:
+        v = env.v_draw(diff, margin)
+        w = env.w_draw(diff, margin)
+    else:
+        v = env.v_win(diff, margin)
+        w = env.w_win(diff, margin)
+
+    mu[winner] += winner_var / c * v
+    mu[loser] -= loser_var / c * v
+    sigma2[winner] = winner_var * (1 - winner_var / c2 * w)
+    sigma2[loser] = loser_var * (1 - loser_var / c2 * w)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run TrueSkill round-robin tournament")
     parser.add_argument(
@@ -12,7 +12,6 @@
 # - Avoids risky situations and corners
 
 import typing
-from collections import deque
 
 
 def info() -> typing.Dict:
@@ -34,73 +33,72 @@ def end(game_state: typing.Dict):
     print("GAME OVER\n")
 
 
-def get_next_position(head: typing.Dict, direction: str) -> typing.Dict:
-    """Calculate the next position given a head position and direction."""
-    x, y = head["x"], head["y"]
-    if direction == "up":
-        return {"x": x, "y": y + 1}
-    elif direction == "down":
-        return {"x": x, "y": y - 1}
-    elif direction == "left":
-        return {"x": x - 1, "y": y}
-    elif direction == "right":
-        return {"x": x + 1, "y": y}
-    return head
+# Moves are handled as indices into DELTAS and only turned into names for the response
+UP, DOWN, LEFT, RIGHT = 0, 1, 2, 3
+DELTAS = ((0, 1), (0, -1), (-1, 0), (1, 0))
+DIR_NAMES = ("up", "down", "left", "right")
 
 
-def is_out_of_bounds(pos: typing.Dict, board_width: int, board_height: int) -> bool:
-    """Check if a position is out of bounds."""
-    return pos["x"] < 0 or pos["x"] >= board_width or pos["y"] < 0 or pos["y"] >= board_height
-
-
-def is_occupied(pos: typing.Dict, snakes: list) -> bool:
-    """Check if a position is occupied by any snake body."""
+def build_occupancy_grid(snakes: list, board_width: int, board_height: int) -> bytearray:
+    """Return a flat grid indexed by y * board_width + x, set to 1 on squares covered by a snake body."""
+    grid = bytearray(board_width * board_height)
     for snake in snakes:
         # Exclude tail since it will move (unless snake just ate, but we'll be conservative)
         body_to_check = snake["body"][:-1] if len(snake["body"]) > 1 else snake["body"]
         for segment in body_to_check:
-            if pos["x"] == segment["x"] and pos["y"] == segment["y"]:
-                return True
-    return False
+            grid[segment["y"] * board_width + segment["x"]] = 1
+    return grid
 
 
 def flood_fill(
-    start_pos: typing.Dict, board_width: int, board_height: int, snakes: list, max_depth: int = 100
+    start_key: int,
+    board_width: int,
+    board_height: int,
+    grid: bytearray,
+    max_depth: int = 100,
+    blocked: typing.Optional[bytearray] = None,
 ) -> int:
     """
     Use flood fill (BFS) to calculate available space from a starting position.
-    Returns the number of reachable squares.
-    """
-    visited = set()
-    queue = deque([start_pos])
-    visited.add((start_pos["x"], start_pos["y"]))
-    count = 0
-
-    while queue and count < max_depth:
-        pos = queue.popleft()
-        count += 1
-
-        # Check all four directions
-        for direction in ["up", "down", "left", "right"]:
-            next_pos = get_next_position(pos, direction)
-            pos_tuple = (next_pos["x"], next_pos["y"])
-
-            # Skip if already visited
-            if pos_tuple in visited:
-                continue
-
-            # Skip if out of bounds
-            if is_out_of_bounds(next_pos, board_width, board_height):
-                continue
-
-            # Skip if occupied by snake
-            if is_occupied(next_pos, snakes):
-                continue
-
-            visited.add(pos_tuple)
-            queue.append(next_pos)
+    Positions are packed as y * board_width + x. Returns the number of reachable squares.
 
-    return count
+    If given, blocked must be a fresh copy of grid; on return it also marks every square
+    the fill discovered.
+    """
+    size = board_width * board_height
+    last_column = board_width - 1
+    # Occupied squares start out marked, so one lookup covers both visited and blocked
+    if blocked is None:
+        blocked = bytearray(grid)
+    blocked[start_key] = 1
+    # The queue only grows, so a plain list works and the for loop below also visits
+    # squares appended while it runs
+    queue = [start_key]
+
+    for key in queue:
+        x = key % board_width
+        # Up and down only need a range check; left and right must not wrap to another row
+        next_key = key + board_width
+        if next_key < size and not blocked[next_key]:
+            blocked[next_key] = 1
+            queue.append(next_key)
+        next_key = key - board_width
+        if next_key >= 0 and not blocked[next_key]:
+            blocked[next_key] = 1
+            queue.append(next_key)
+        if x > 0 and not blocked[key - 1]:
+            blocked[key - 1] = 1
+            queue.append(key - 1)
+        if x < last_column and not blocked[key + 1]:
+            blocked[key + 1] = 1
+            queue.append(key + 1)
+
+        # Every discovered square is reachable, so stop once max_depth of them are known
+        # instead of expanding the rest of the frontier
+        if len(queue) >= max_depth:
+            return max_depth
+
+    return len(queue)
 
 
 def manhattan_distance(pos1: typing.Dict, pos2: typing.Dict) -> int:
@@ -115,16 +113,18 @@ def get_nearest_food(head: typing.Dict, food_list: list) -> typing.Dict:
     return min(food_list, key=lambda food: manhattan_distance(head, food))
 
 
-def is_head_to_head_risky(pos: typing.Dict, my_length: int, opponents: list) -> bool:
-    """Check if a position is risky due to nearby opponent heads."""
+def head_to_head_risky_keys(my_length: int, opponents: list, board_width: int, board_height: int) -> typing.Set[int]:
+    """Return the packed keys of squares adjacent to (or on) the head of a larger or equal opponent."""
+    risky = set()
     for opponent in opponents:
-        opponent_head = opponent["body"][0]
-        opponent_length = len(opponent["body"])
-
-        # If opponent is larger or equal and head is adjacent to our potential position
-        if opponent_length >= my_length and manhattan_distance(pos, opponent_head) <= 1:
-            return True
-    return False
+        if len(opponent["body"]) < my_length:
+            continue
+        head = opponent["body"][0]
+        for dx, dy in ((0, 0), (0, 1), (0, -1), (-1, 0), (1, 0)):
+            x, y = head["x"] + dx, head["y"] + dy
+            if 0 <= x < board_width and 0 <= y < board_height:
+                risky.add(y * board_width + x)
+    return risky
 
 
 def move(game_state: typing.Dict) -> typing.Dict:
@@ -141,90 +141,102 @@ def move(game_state: typing.Dict) -> typing.Dict:
     # Get opponent snakes (exclude ourselves)
     opponents = [s for s in all_snakes if s["id"] != game_state["you"]["id"]]
 
+    # Precompute blocked and risky squares once per turn as packed y * width + x keys
+    grid = build_occupancy_grid(all_snakes, board_width, board_height)
+    risky = head_to_head_risky_keys(my_length, opponents, board_width, board_height)
+
+    head_x, head_y = my_head["x"], my_head["y"]
+
+    # The nearest food doesn't depend on the move, so find it once
+    nearest_food = get_nearest_food(my_head, food) if my_health < 50 else None
+    if nearest_food:
+        food_x, food_y = nearest_food["x"], nearest_food["y"]
+        current_distance = manhattan_distance(my_head, nearest_food)
+
     # Evaluate all possible moves
-    moves = ["up", "down", "left", "right"]
-    move_scores = {}
-    move_spaces = {}
+    move_scores = [0, 0, 0, 0]
+    move_spaces = [0, 0, 0, 0]
+    # (discovered squares, space) for each flood fill run this turn
+    regions = []
 
-    for direction in moves:
-        next_pos = get_next_position(my_head, direction)
+    for direction, (dx, dy) in enumerate(DELTAS):
+        next_x, next_y = head_x + dx, head_y + dy
         score = 100  # Start with base score
 
         # Check if move is safe
 
         # Avoid out of bounds
-        if is_out_of_bounds(next_pos, board_width, board_height):
-            score = -1000
-            move_spaces[direction] = 0
-            move_scores[direction] = score
+        if next_x < 0 or next_x >= board_width or next_y < 0 or next_y >= board_height:
+            move_scores[direction] = -1000
             continue
 
+        next_key = next_y * board_width + next_x
+
         # Avoid colliding with any snake (including ourselves)
-        if is_occupied(next_pos, all_snakes):
-            score = -1000
-            move_spaces[direction] = 0
-            move_scores[direction] = score
+        if grid[next_key]:
+            move_scores[direction] = -1000
             continue
 
         # Avoid head-to-head collisions with larger or equal opponents
-        if is_head_to_head_risky(next_pos, my_length, opponents):
+        if next_key in risky:
             score -= 300  # Penalize but don't eliminate
 
-        # Calculate available space using flood fill (most important metric)
-        available_space = flood_fill(next_pos, board_width, board_height, all_snakes)
+        # Calculate available space using flood fill (most important metric). Squares in
+        # a region an earlier fill reached have the same min(region size, max_depth) space,
+        # so only fill from squares no earlier fill has discovered
+        for discovered, space in regions:
+            if discovered[next_key]:
+                available_space = space
+                break
+        else:
+            discovered = bytearray(grid)
+            available_space = flood_fill(next_key, board_width, board_height, grid, blocked=discovered)
+            regions.append((discovered, available_space))
         move_spaces[direction] = available_space
 
         # Space is the primary factor
         score += available_space * 10
 
-        # If health is critically low, prioritize food
-        if my_health < 20:
-            nearest_food = get_nearest_food(my_head, food)
-            if nearest_food:
-                current_distance = manhattan_distance(my_head, nearest_food)
-                new_distance = manhattan_distance(next_pos, nearest_food)
+        if nearest_food:
+            new_distance = abs(next_x - food_x) + abs(next_y - food_y)
 
+            # If health is critically low, prioritize food
+            if my_health < 20:
                 if new_distance < current_distance:
                     score += 500  # Strong incentive to get food when health is low
                 elif new_distance > current_distance:
                     score -= 200
 
-        # If health is moderately low, consider food but don't prioritize it
-        elif my_health < 50 and food:
-            nearest_food = get_nearest_food(my_head, food)
-            if nearest_food:
-                current_distance = manhattan_distance(my_head, nearest_food)
-                new_distance = manhattan_distance(next_pos, nearest_food)
-
-                if new_distance < current_distance:
-                    score += 50
+            # If health is moderately low, consider food but don't prioritize it
+            elif new_distance < current_distance:
+                score += 50
 
         # Avoid edges when possible (give us more options)
         edge_penalty = 0
-        if next_pos["x"] == 0 or next_pos["x"] == board_width - 1:
+        if next_x == 0 or next_x == board_width - 1:
             edge_penalty += 20
-        if next_pos["y"] == 0 or next_pos["y"] == board_height - 1:
+        if next_y == 0 or next_y == board_height - 1:
             edge_penalty += 20
         score -= edge_penalty
 
         move_scores[direction] = score
 
     # Choose the best move based on score
-    best_moves = [m for m in moves if move_scores[m] > 0]
+    best_moves = [d for d in range(4) if move_scores[d] > 0]
 
     if not best_moves:
         # No good moves, pick the least bad one
         print(f"MOVE {game_state['turn']}: No ideal moves! Picking least bad option")
-        next_move = max(moves, key=lambda m: move_scores[m])
+        next_move = max(range(4), key=move_scores.__getitem__)
     else:
         # Choose the move with the highest score
-        next_move = max(best_moves, key=lambda m: move_scores[m])
+        next_move = max(best_moves, key=move_scores.__getitem__)
 
     print(
-        f"MOVE {game_state['turn']}: {next_move} (score: {move_scores[next_move]}, "
+        f"MOVE {game_state['turn']}: {DIR_NAMES[next_move]} (score: {move_scores[next_move]}, "
         f"space: {move_spaces[next_move]}, health: {my_health})"
     )
-    return {"move": next_move}
+    return {"move": DIR_NAMES[next_move]}
 
 
 # Start server when `python main.py` is run
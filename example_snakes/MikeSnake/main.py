@@ -6,9 +6,12 @@
 #  |________/(______/__|  |__| |____/\_____>______>___|__(______/__|__\\_____>
 #
 
+import logging
 import random
 import typing
-from collections import deque
+
+# Decision traces go to debug so they cost nothing unless logging is configured for them
+logger = logging.getLogger(__name__)
 
 # ============================================================================
 # STRATEGY CONFIGURATION
@@ -20,6 +23,12 @@ LOW_HEALTH_THRESHOLD = 30  # Food seeking threshold
 CRITICAL_HEALTH_THRESHOLD = 15  # Critical threshold
 HUNT_REWARD_THRESHOLD = 3  # Hunt reward threshold
 
+# (dx, dy) for each move
+MOVE_DELTA = {"up": (0, 1), "down": (0, -1), "left": (-1, 0), "right": (1, 0)}
+# Per-move state is kept in 4-entry lists indexed like MOVE_NAMES, and the safe
+# moves as a bitmask with bit i set when MOVE_NAMES[i] is safe
+MOVE_NAMES = tuple(MOVE_DELTA)
+
 
 # ============================================================================
 # API FUNCTIONS
@@ -47,37 +56,44 @@ def end(game_state: typing.Dict):
 def move(game_state: typing.Dict) -> typing.Dict:
     """Core movement logic - fully enhanced version"""
 
-    my_head = game_state["you"]["body"][0]
-    my_body = game_state["you"]["body"]
+    # Positions are (x, y) tuples from here on; the API's {"x", "y"} dicts are converted once
+    my_body = _to_cells(game_state["you"]["body"])
+    my_head = my_body[0]
     my_length = len(my_body)
     my_health = game_state["you"]["health"]
     board_width = game_state['board']['width']
     board_height = game_state['board']['height']
-    food = game_state['board']['food']
+    food = _to_cells(game_state['board']['food'])
+    # Distance from our head to each food, shared by every food-related layer
+    food_distances = [abs(fx - my_head[0]) + abs(fy - my_head[1]) for fx, fy in food]
     all_snakes = game_state['board']['snakes']
 
-    opponents = [snake for snake in all_snakes if snake['id'] != game_state['you']['id']]
-
-    possible_moves = ["up", "down", "left", "right"]
-    move_scores = {move: 0 for move in possible_moves}
-
-    # Layer 1: Basic safety
-    safe_moves_mask = _evaluate_basic_safety(
-        my_head, my_body, opponents,
-        board_width, board_height,
-        move_scores, possible_moves
-    )
-
-    # Layer 2: Space evaluation (using dynamic depth flood fill)
-    _evaluate_space_availability(
-        my_head, my_body, my_length, opponents,
+    # Each opponent is represented by its body, head first
+    opponents = [_to_cells(snake['body']) for snake in all_snakes if snake['id'] != game_state['you']['id']]
+    # (head, length) of each opponent, in the same order as opponents
+    opponent_stats = [(opponent[0], len(opponent)) for opponent in opponents]
+    opponent_lengths = [length for _, length in opponent_stats]
+
+    # Obstacles are built once per turn and shared by all layers: cells covered by opponent
+    # bodies (tails excluded), and those plus our own body minus its tail. The grids hold the
+    # same cells as flat bytearrays indexed by y * board_width + x, for flood fills
+    opponent_blocked = _build_opponent_blocked(opponents)
+    blocked = opponent_blocked.union(my_body[:-1])
+    blocked_grid = _build_grid(blocked, board_width, board_height)
+
+    move_scores = [0, 0, 0, 0]
+    # Where our head lands for each move, shared by every layer
+    next_positions = [_get_next_position(my_head, move) for move in MOVE_NAMES]
+
+    # Layers 1 and 2: Basic safety, then space evaluation (using dynamic depth flood fill)
+    safe_moves_mask = _evaluate_safety_and_space(
+        next_positions, my_body, my_length, blocked, blocked_grid,
         board_width, board_height,
-        move_scores, possible_moves, safe_moves_mask,
-        game_state
+        move_scores
     )
 
     # Patch 5: Dynamically calculate aggressive threshold
-    dynamic_threshold = _calculate_dynamic_aggressive_threshold(game_state)
+    dynamic_threshold = _calculate_dynamic_aggressive_threshold(my_length, opponent_lengths)
 
     is_aggressive = my_length >= dynamic_threshold and my_health > LOW_HEALTH_THRESHOLD
     is_critical = my_health < CRITICAL_HEALTH_THRESHOLD
@@ -86,50 +102,50 @@ def move(game_state: typing.Dict) -> typing.Dict:
     # Emergency mode (enhanced version, considers third-party threats)
     if is_critical and opponents:
         _evaluate_emergency_strategy_enhanced(
-            my_head, my_body, my_length, my_health,
-            food, opponents, board_width, board_height,
-            move_scores, possible_moves, safe_moves_mask,
-            game_state
+            my_head, next_positions, my_body, my_length, my_health,
+            food, food_distances, opponent_stats, board_width, board_height,
+            move_scores, safe_moves_mask,
+            blocked_grid, opponent_blocked
         )
 
     # Normal food seeking (smart food selection)
     elif food and (need_food or not is_aggressive):
         _evaluate_food_seeking_smart(
-            my_head, food, move_scores,
-            possible_moves, safe_moves_mask,
+            next_positions, my_body, my_length, opponent_stats, food, food_distances, move_scores,
+            safe_moves_mask,
             is_critical, need_food,
-            game_state
+            board_width, board_height, blocked_grid, opponent_blocked
         )
 
     # Aggressive strategy
     if is_aggressive and opponents:
         _evaluate_aggressive_strategy(
-            my_head, my_length, opponents,
-            move_scores, possible_moves, safe_moves_mask
+            next_positions, my_length, opponent_stats,
+            move_scores, safe_moves_mask
         )
 
     # Head-to-head defense (2-step prediction)
     if opponents:
         _evaluate_head_to_head_defense_enhanced(
-            my_head, my_length, opponents,
+            next_positions, my_length, opponents, opponent_stats,
             board_width, board_height,
-            move_scores, possible_moves, safe_moves_mask
+            move_scores, safe_moves_mask
         )
 
     # Position preference
     _evaluate_position_preference(
-        my_head, board_width, board_height,
-        move_scores, possible_moves, safe_moves_mask
+        next_positions, board_width, board_height,
+        move_scores, safe_moves_mask
     )
 
     # Select best move
-    safe_moves = [m for m in possible_moves if safe_moves_mask[m] and move_scores[m] > -9000]
+    safe_moves = [i for i in range(4) if safe_moves_mask >> i & 1 and move_scores[i] > -9000]
 
     if not safe_moves:
-        next_move = max(possible_moves, key=lambda m: move_scores[m])
+        next_move = MOVE_NAMES[max(range(4), key=move_scores.__getitem__)]
         print(f"MOVE {game_state['turn']}: {next_move} (NO SAFE MOVES!)")
     else:
-        next_move = max(safe_moves, key=lambda m: move_scores[m])
+        next_move = MOVE_NAMES[max(safe_moves, key=move_scores.__getitem__)]
         mode = "CRITICAL" if is_critical else ("AGGRESSIVE" if is_aggressive else "SURVIVAL")
         print(f"MOVE {game_state['turn']}: {next_move} | {mode} | Threshold={dynamic_threshold}")
 
@@ -140,24 +156,20 @@ def move(game_state: typing.Dict) -> typing.Dict:
 # Patch 5: Dynamic Aggressive Threshold Calculation
 # ============================================================================
 
-def _calculate_dynamic_aggressive_threshold(game_state: typing.Dict) -> int:
+def _calculate_dynamic_aggressive_threshold(my_length: int, opponent_lengths: typing.List[int]) -> int:
     """
     Dynamically calculate aggressive threshold based on current game state
 
     Patch 5 - Solves the problem of fixed thresholds being easily predictable
     """
-    my_length = len(game_state['you']['body'])
-    opponents = [s for s in game_state['board']['snakes']
-                 if s['id'] != game_state['you']['id']]
-
-    if not opponents:
+    if not opponent_lengths:
         return 6  # No opponents, can be aggressive
 
     # Calculate average opponent length
-    avg_opponent_length = sum(len(s['body']) for s in opponents) / len(opponents)
+    avg_opponent_length = sum(opponent_lengths) / len(opponent_lengths)
 
     # Calculate strongest opponent length
-    max_opponent_length = max(len(s['body']) for s in opponents)
+    max_opponent_length = max(opponent_lengths)
 
     # Strategy 1: If opponents are generally much stronger, be conservative
     if avg_opponent_length > my_length + 3:
@@ -172,11 +184,11 @@ def _calculate_dynamic_aggressive_threshold(game_state: typing.Dict) -> int:
         return 6
 
     # Strategy 4: Many opponents, be conservative
-    if len(opponents) >= 4:
+    if len(opponent_lengths) >= 4:
         return 9
 
     # Strategy 5: Few opponents, can be somewhat aggressive
-    if len(opponents) <= 2:
+    if len(opponent_lengths) <= 2:
         return 7
 
     # Default
@@ -187,67 +199,46 @@ def _calculate_dynamic_aggressive_threshold(game_state: typing.Dict) -> int:
 # EVALUATION LAYERS
 # ============================================================================
 
-def _evaluate_basic_safety(
-        my_head, my_body, opponents, board_width, board_height, move_scores, possible_moves
-):
-    """Layer 1: Basic safety"""
-    safe_mask = {move: True for move in possible_moves}
-    my_neck = my_body[1] if len(my_body) > 1 else None
-
-    for move in possible_moves:
-        next_pos = _get_next_position(my_head, move)
-
-        if my_neck and next_pos['x'] == my_neck['x'] and next_pos['y'] == my_neck['y']:
-            move_scores[move] -= 10000
-            safe_mask[move] = False
-            continue
-
-        if not _is_in_bounds(next_pos, board_width, board_height):
-            move_scores[move] -= 10000
-            safe_mask[move] = False
-            continue
-
-        if _is_collision_with_body(next_pos, my_body[:-1]):
-            move_scores[move] -= 10000
-            safe_mask[move] = False
-            continue
-
-        if _is_collision_with_opponents(next_pos, opponents, exclude_tails=True):
-            move_scores[move] -= 10000
-            safe_mask[move] = False
-            continue
-
-    return safe_mask
-
-
-def _evaluate_space_availability(
-        my_head, my_body, my_length, opponents, board_width, board_height,
-        move_scores, possible_moves, safe_mask, game_state
+def _evaluate_safety_and_space(
+        next_positions, my_body, my_length, blocked, blocked_grid, board_width, board_height,
+        move_scores
 ):
     """
-    Layer 2: Space evaluation
+    Layer 1: Basic safety, fused with Layer 2: Space evaluation
     Patch 1 - Use dynamic depth flood fill
     """
-    for move in possible_moves:
-        if not safe_mask[move]:
+    safe_mask = 0
+    my_neck = my_body[1] if len(my_body) > 1 else None
+
+    for i in range(4):
+        next_pos = next_positions[i]
+
+        # Layer 1: moves into our neck, a wall or any body are fatal
+        if ((my_neck and next_pos == my_neck) or
+                not _is_in_bounds(next_pos, board_width, board_height) or
+                next_pos in blocked):
+            move_scores[i] -= 10000
             continue
+        safe_mask |= 1 << i
 
-        next_pos = _get_next_position(my_head, move)
-        available_space = _flood_fill_dynamic(next_pos, game_state)
+        # Layer 2: space available after a safe move
+        available_space = _flood_fill_dynamic(next_pos, my_length, board_width, board_height, blocked_grid)
 
-        move_scores[move] += available_space * 10
+        move_scores[i] += available_space * 10
 
         if available_space < my_length:
             penalty = (my_length - available_space) * 50
-            move_scores[move] -= penalty
+            move_scores[i] -= penalty
 
             if available_space < my_length // 2:
-                move_scores[move] -= 200
+                move_scores[i] -= 200
+
+    return safe_mask
 
 
 def _evaluate_emergency_strategy_enhanced(
-        my_head, my_body, my_length, my_health, food, opponents,
-        board_width, board_height, move_scores, possible_moves, safe_mask, game_state
+        my_head, next_positions, my_body, my_length, my_health, food, food_distances, opponent_stats,
+        board_width, board_height, move_scores, safe_mask, blocked_grid, opponent_blocked
 ):
     """
     Emergency strategy (enhanced version)
@@ -258,8 +249,9 @@ def _evaluate_emergency_strategy_enhanced(
 
     # Evaluate food options
     if food:
-        closest_food = min(food, key=lambda f: _manhattan_distance(my_head, f))
-        food_distance = _manhattan_distance(my_head, closest_food)
+        # First food at the smallest precomputed distance
+        food_distance = min(food_distances)
+        closest_food = food[food_distances.index(food_distance)]
 
         if food_distance < my_health:
             best_food_option = {
@@ -269,10 +261,7 @@ def _evaluate_emergency_strategy_enhanced(
             }
 
     # Evaluate hunt options (enhanced version)
-    for opponent in opponents:
-        opponent_length = len(opponent['body'])
-        opponent_head = opponent['body'][0]
-
+    for index, (opponent_head, opponent_length) in enumerate(opponent_stats):
         if opponent_length >= my_length:
             continue
 
@@ -285,27 +274,19 @@ def _evaluate_emergency_strategy_enhanced(
 
         # New: Check third-party threats
         third_party_threat = 0
-        for other_opponent in opponents:
-            if other_opponent['id'] == opponent['id']:
+        for other_index, (other_head, other_length) in enumerate(opponent_stats):
+            if other_index == index:
                 continue
 
-            other_length = len(other_opponent['body'])
-            other_head = other_opponent['body'][0]
-
             if other_length >= my_length:
                 distance_to_other = _manhattan_distance(opponent_head, other_head)
 
                 if distance_to_other <= 5:
                     third_party_threat += 200 / (distance_to_other + 1)
 
-        # New: Evaluate chase path safety
-        temp_game_state = game_state.copy()
-        temp_game_state['you'] = {
-            'id': game_state['you']['id'],
-            'body': [opponent_head] + game_state['you']['body'][:-1],
-            'health': game_state['you']['health']
-        }
-        chase_space = _flood_fill_dynamic(opponent_head, temp_game_state)
+        # New: Evaluate chase path safety (space once our head reaches the opponent's)
+        chase_grid = _advance_grid(blocked_grid, my_body, opponent_head, opponent_blocked, board_width)
+        chase_space = _flood_fill_dynamic(opponent_head, my_length, board_width, board_height, chase_grid)
         chase_path_safe = chase_space >= my_length
 
         # Comprehensive score (includes new risk factors)
@@ -335,73 +316,77 @@ def _evaluate_emergency_strategy_enhanced(
                 best_hunt_option['path_safe'] and
                 best_hunt_option['third_party_risk'] < 100):
 
-            _apply_hunting_strategy(my_head, best_hunt_option, move_scores, possible_moves, safe_mask)
-            print(
-                f"EMERGENCY: HUNTING (score={best_hunt_option['score']:.0f}, risk={best_hunt_option['third_party_risk']:.0f})")
+            _apply_hunting_strategy(next_positions, best_hunt_option, move_scores, safe_mask)
+            logger.debug(
+                "EMERGENCY: HUNTING (score=%.0f, risk=%.0f)",
+                best_hunt_option['score'], best_hunt_option['third_party_risk']
+            )
         else:
-            _apply_food_seeking(my_head, best_food_option['target'], move_scores, possible_moves, safe_mask, 500)
-            print(f"EMERGENCY: FOOD (hunt too risky)")
+            _apply_food_seeking(next_positions, best_food_option['target'], move_scores, safe_mask, 500)
+            logger.debug("EMERGENCY: FOOD (hunt too risky)")
 
     elif best_hunt_option:
-        _apply_hunting_strategy(my_head, best_hunt_option, move_scores, possible_moves, safe_mask)
-        print(f"EMERGENCY: HUNTING (no food)")
+        _apply_hunting_strategy(next_positions, best_hunt_option, move_scores, safe_mask)
+        logger.debug("EMERGENCY: HUNTING (no food)")
 
     elif best_food_option:
-        _apply_food_seeking(my_head, best_food_option['target'], move_scores, possible_moves, safe_mask, 500)
-        print(f"EMERGENCY: FOOD")
+        _apply_food_seeking(next_positions, best_food_option['target'], move_scores, safe_mask, 500)
+        logger.debug("EMERGENCY: FOOD")
 
 
-def _apply_hunting_strategy(my_head, hunt_option, move_scores, possible_moves, safe_mask):
+def _apply_hunting_strategy(next_positions, hunt_option, move_scores, safe_mask):
     """Apply hunting strategy"""
     target = hunt_option['target']
 
-    for move in possible_moves:
-        if not safe_mask[move]:
+    for i in range(4):
+        if not safe_mask >> i & 1:
             continue
 
-        next_pos = _get_next_position(my_head, move)
+        next_pos = next_positions[i]
         distance = _manhattan_distance(next_pos, target)
-        move_scores[move] += hunt_option['score'] / (distance + 1)
+        move_scores[i] += hunt_option['score'] / (distance + 1)
 
 
-def _apply_food_seeking(my_head, target_food, move_scores, possible_moves, safe_mask, weight):
+def _apply_food_seeking(next_positions, target_food, move_scores, safe_mask, weight):
     """Apply food seeking strategy"""
-    for move in possible_moves:
-        if not safe_mask[move]:
+    for i in range(4):
+        if not safe_mask >> i & 1:
             continue
 
-        next_pos = _get_next_position(my_head, move)
+        next_pos = next_positions[i]
         distance = _manhattan_distance(next_pos, target_food)
-        move_scores[move] += weight / (distance + 1)
+        move_scores[i] += weight / (distance + 1)
 
 
 def _evaluate_food_seeking_smart(
-        my_head, food, move_scores, possible_moves, safe_mask,
-        is_critical, need_food, game_state
+        next_positions, my_body, my_length, opponent_stats, food, food_distances, move_scores, safe_mask,
+        is_critical, need_food, board_width, board_height, blocked_grid, opponent_blocked
 ):
     """
     Smart food selection (Patch 4)
     Comprehensively considers distance, space, and threats
     """
-    my_length = len(game_state['you']['body'])
-    opponents = [s for s in game_state['board']['snakes'] if s['id'] != game_state['you']['id']]
+    # Only opponents at least as long as us can contest food; the same for every food
+    threat_heads = [head for head, length in opponent_stats if length >= my_length]
 
-    food_evaluations = []
+    food_scores = []
 
-    for f in food:
-        distance = _manhattan_distance(my_head, f)
+    for f, distance in zip(food, food_distances):
         distance_score = 100.0 / (distance + 1)
 
-        space = _estimate_space_after_reaching(f, game_state)
+        space = _estimate_space_after_reaching(
+            f, my_body, board_width, board_height, blocked_grid, opponent_blocked
+        )
         space_score = space * 2.0
 
-        threat = _count_threats_near(f, opponents, my_length, my_head)
+        threat = _count_threats_near(f, threat_heads, distance)
         threat_score = -threat
 
         total_score = distance_score + space_score + threat_score
-        food_evaluations.append((f, total_score))
+        food_scores.append(total_score)
 
-    best_food = max(food_evaluations, key=lambda x: x[1])[0]
+    # First food with the highest score
+    best_food = food[food_scores.index(max(food_scores))]
 
     if is_critical:
         food_weight = 200
@@ -410,138 +395,146 @@ def _evaluate_food_seeking_smart(
     else:
         food_weight = 30
 
-    for move in possible_moves:
-        if not safe_mask[move]:
+    for i in range(4):
+        if not safe_mask >> i & 1:
             continue
 
-        next_pos = _get_next_position(my_head, move)
+        next_pos = next_positions[i]
         distance_to_best = _manhattan_distance(next_pos, best_food)
-        move_scores[move] += food_weight / (distance_to_best + 1)
+        move_scores[i] += food_weight / (distance_to_best + 1)
 
 
-def _evaluate_aggressive_strategy(my_head, my_length, opponents, move_scores, possible_moves, safe_mask):
+def _evaluate_aggressive_strategy(next_positions, my_length, opponent_stats, move_scores, safe_mask):
     """Aggressive strategy"""
-    for opponent in opponents:
-        opponent_head = opponent['body'][0]
-        opponent_length = len(opponent['body'])
-
+    for opponent_head, opponent_length in opponent_stats:
         if opponent_length < my_length:
-            for move in possible_moves:
-                if not safe_mask[move]:
+            for i in range(4):
+                if not safe_mask >> i & 1:
                     continue
 
-                next_pos = _get_next_position(my_head, move)
+                next_pos = next_positions[i]
                 distance = _manhattan_distance(next_pos, opponent_head)
-                move_scores[move] += 50 / (distance + 1)
+                move_scores[i] += 50 / (distance + 1)
 
         elif opponent_length >= my_length:
-            for move in possible_moves:
-                if not safe_mask[move]:
+            for i in range(4):
+                if not safe_mask >> i & 1:
                     continue
 
-                next_pos = _get_next_position(my_head, move)
+                next_pos = next_positions[i]
                 distance = _manhattan_distance(next_pos, opponent_head)
 
                 if distance <= 2:
-                    move_scores[move] -= 100 / (distance + 1)
+                    move_scores[i] -= 100 / (distance + 1)
 
 
 def _evaluate_head_to_head_defense_enhanced(
-        my_head, my_length, opponents, board_width, board_height,
-        move_scores, possible_moves, safe_mask
+        next_positions, my_length, opponents, opponent_stats, board_width, board_height,
+        move_scores, safe_mask
 ):
     """
     Head-to-head defense (enhanced version)
     Patch 3 - Use 2-step prediction
     """
-    for opponent in opponents:
-        opponent_head = opponent['body'][0]
-        opponent_length = len(opponent['body'])
+    for opponent, (opponent_head, opponent_length) in zip(opponents, opponent_stats):
 
         if opponent_length >= my_length:
-            # Use 2-step prediction
-            predicted_positions = _predict_opponent_next_moves(
+            # Use 2-step prediction, as a set so each move is a single lookup
+            predicted_positions = frozenset(_predict_opponent_next_moves(
                 opponent, board_width, board_height, depth=2
-            )
+            ))
 
-            for move in possible_moves:
-                if not safe_mask[move]:
+            for i in range(4):
+                if not safe_mask >> i & 1:
                     continue
 
-                next_pos = _get_next_position(my_head, move)
+                next_pos = next_positions[i]
 
-                for pred_pos in predicted_positions:
-                    if _positions_equal(next_pos, pred_pos):
-                        distance = _manhattan_distance(next_pos, opponent_head)
+                if next_pos in predicted_positions:
+                    distance = _manhattan_distance(next_pos, opponent_head)
 
-                        if distance <= 1:
-                            penalty = 400 + (opponent_length - my_length) * 50
-                        else:
-                            penalty = 200 + (opponent_length - my_length) * 30
+                    if distance <= 1:
+                        penalty = 400 + (opponent_length - my_length) * 50
+                    else:
+                        penalty = 200 + (opponent_length - my_length) * 30
 
-                        move_scores[move] -= penalty
-                        break
+                    move_scores[i] -= penalty
 
 
-def _evaluate_position_preference(my_head, board_width, board_height, move_scores, possible_moves, safe_mask):
+def _evaluate_position_preference(next_positions, board_width, board_height, move_scores, safe_mask):
     """Position preference"""
     center_x = board_width / 2
     center_y = board_height / 2
 
-    for move in possible_moves:
-        if not safe_mask[move]:
+    for i in range(4):
+        if not safe_mask >> i & 1:
             continue
 
-        next_pos = _get_next_position(my_head, move)
-        distance_to_center = abs(next_pos['x'] - center_x) + abs(next_pos['y'] - center_y)
-        move_scores[move] += 5 / (distance_to_center + 1)
+        next_pos = next_positions[i]
+        distance_to_center = abs(next_pos[0] - center_x) + abs(next_pos[1] - center_y)
+        move_scores[i] += 5 / (distance_to_center + 1)
 
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+def _to_cells(points):
+    """Convert a list of API {"x", "y"} points to (x, y) tuples"""
+    return [(point['x'], point['y']) for point in points]
+
+
 def _get_next_position(position, move):
-    x, y = position['x'], position['y']
-    if move == "up":
-        return {"x": x, "y": y + 1}
-    elif move == "down":
-        return {"x": x, "y": y - 1}
-    elif move == "left":
-        return {"x": x - 1, "y": y}
-    elif move == "right":
-        return {"x": x + 1, "y": y}
-    return position
+    dx, dy = MOVE_DELTA[move]
+    return (position[0] + dx, position[1] + dy)
 
 
 def _is_in_bounds(position, width, height):
-    return 0 <= position['x'] < width and 0 <= position['y'] < height
+    x, y = position
+    return 0 <= x < width and 0 <= y < height
 
 
-def _is_collision_with_body(position, body):
-    return any(position['x'] == segment['x'] and position['y'] == segment['y'] for segment in body)
+def _build_opponent_blocked(opponents):
+    """Return the cells covered by opponent bodies, excluding tails since they move this turn"""
+    return {segment for opponent in opponents for segment in opponent[:-1]}
 
 
-def _is_collision_with_opponents(position, opponents, exclude_tails=True):
-    for opponent in opponents:
-        body = opponent['body'][:-1] if exclude_tails else opponent['body']
-        if _is_collision_with_body(position, body):
-            return True
-    return False
+def _build_grid(cells, width, height):
+    """Return a flat bytearray indexed by y * width + x with the given cells set to 1"""
+    grid = bytearray(width * height)
+    for x, y in cells:
+        grid[y * width + x] = 1
+    return grid
 
 
-def _manhattan_distance(pos1, pos2):
-    return abs(pos1['x'] - pos2['x']) + abs(pos1['y'] - pos2['y'])
+def _advance_grid(blocked_grid, my_body, new_head, opponent_blocked, width):
+    """
+    Return a copy of this turn's blocked_grid with our body advanced so its head is at
+    new_head, i.e. the grid for [new_head] + my_body[:-1] minus its tail. Only two cells
+    can differ, so the grid is patched instead of rebuilt.
+    """
+    grid = bytearray(blocked_grid)
+    if len(my_body) < 2:
+        # A one-segment body is all tail, before and after, so it never blocks a cell
+        return grid
+    # The segment before the tail becomes the new tail; its cell frees up unless
+    # another segment or an opponent still covers it
+    vacated = my_body[-2]
+    if vacated not in opponent_blocked and vacated not in my_body[:-2]:
+        grid[vacated[1] * width + vacated[0]] = 0
+    grid[new_head[1] * width + new_head[0]] = 1
+    return grid
 
 
-def _positions_equal(pos1, pos2):
-    return pos1['x'] == pos2['x'] and pos1['y'] == pos2['y']
+def _manhattan_distance(pos1, pos2):
+    return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
 
 
 def _get_possible_next_positions(position, width, height):
     possible = []
-    for move in ["up", "down", "left", "right"]:
-        next_pos = _get_next_position(position, move)
+    x, y = position
+    for dx, dy in MOVE_DELTA.values():
+        next_pos = (x + dx, y + dy)
         if _is_in_bounds(next_pos, width, height):
             possible.append(next_pos)
     return possible
@@ -551,25 +544,15 @@ def _get_possible_next_positions(position, width, height):
 # Patch 1: Dynamic Flood Fill
 # ============================================================================
 
-def _flood_fill_dynamic(start_pos, game_state):
+def _flood_fill_dynamic(start_pos, my_length, board_width, board_height, blocked_grid):
     """
     Flood fill algorithm (dynamic depth version)
     Patch 1 - Dynamically adjust search depth based on map size
-    """
-    board_width = game_state['board']['width']
-    board_height = game_state['board']['height']
-    my_body = game_state['you']['body']
-    my_length = len(my_body)
-    all_snakes = game_state['board']['snakes']
 
-    obstacles = set()
-    for segment in my_body[:-1]:
-        obstacles.add((segment['x'], segment['y']))
-
-    for snake in all_snakes:
-        if snake['id'] != game_state['you']['id']:
-            for segment in snake['body'][:-1]:
-                obstacles.add((segment['x'], segment['y']))
+    blocked_grid marks every obstacle, including our own (possibly hypothetical) body.
+    """
+    # Work on a copy; it also serves as the visited map, so one byte lookup covers both checks
+    blocked = bytearray(blocked_grid)
 
     # Dynamically calculate maximum iterations
     board_size = board_width * board_height
@@ -584,29 +567,52 @@ def _flood_fill_dynamic(start_pos, game_state):
     # Early termination condition
     safe_space = my_length * 3
 
-    visited = set()
-    queue = deque([start_pos])
-    start_tuple = (start_pos['x'], start_pos['y'])
-    visited.add(start_tuple)
+    # The fill stops at whichever cap is hit first, so its result is
+    # min(reachable cells, base_max, safe_space) regardless of visiting order
+    limit = min(base_max, safe_space)
+
+    # Scanline fill: each step claims a whole horizontal run of free cells (found and
+    # marked with C-level bytearray searches and slice assignment) and queues one seed
+    # per free run touching it in the rows above and below.
+    # Cells are packed as y * board_width + x.
+    start_key = start_pos[1] * board_width + start_pos[0]
+    # The start cell is always counted, even when it is an obstacle (e.g. an opponent's head)
+    blocked[start_key] = 0
+    run_of_ones = b"\x01" * board_width
+    seeds = [start_key]
     count = 0
 
-    while queue and count < base_max:
-        current = queue.popleft()
-        count += 1
+    while seeds:
+        key = seeds.pop()
+        if blocked[key]:
+            # Already claimed as part of a run reached from another seed
+            continue
 
-        # Early termination optimization
-        if count >= safe_space:
-            break
+        row_start = key - key % board_width
+        row_end = row_start + board_width
+        left = blocked.rfind(1, row_start, key) + 1 or row_start
+        right = blocked.find(1, key, row_end)
+        if right == -1:
+            right = row_end
+        run_length = right - left
+        blocked[left:right] = run_of_ones[:run_length]
 
-        for move in ["up", "down", "left", "right"]:
-            next_pos = _get_next_position(current, move)
-            pos_tuple = (next_pos['x'], next_pos['y'])
+        count += run_length
+        # Early termination optimization
+        if count >= limit:
+            return limit
 
-            if (pos_tuple not in visited and
-                    pos_tuple not in obstacles and
-                    _is_in_bounds(next_pos, board_width, board_height)):
-                visited.add(pos_tuple)
-                queue.append(next_pos)
+        for neighbor_left in (left - board_width, left + board_width):
+            if not 0 <= neighbor_left < board_size:
+                continue
+            neighbor_right = neighbor_left + run_length
+            free = blocked.find(0, neighbor_left, neighbor_right)
+            while free != -1:
+                seeds.append(free)
+                taken = blocked.find(1, free, neighbor_right)
+                if taken == -1:
+                    break
+                free = blocked.find(0, taken, neighbor_right)
 
     return count
 
@@ -615,30 +621,25 @@ def _flood_fill_dynamic(start_pos, game_state):
 # Patch 4: Smart Food Selection Helper Functions
 # ============================================================================
 
-def _estimate_space_after_reaching(food_pos, game_state):
+def _estimate_space_after_reaching(food_pos, my_body, board_width, board_height, blocked_grid, opponent_blocked):
     """Estimate space after reaching food position"""
-    temp_state = {
-        'board': game_state['board'],
-        'you': {
-            'id': game_state['you']['id'],
-            'body': [food_pos] + game_state['you']['body'][:-1],
-            'health': game_state['you']['health']
-        }
-    }
-    return _flood_fill_dynamic(food_pos, temp_state)
+    future_grid = _advance_grid(blocked_grid, my_body, food_pos, opponent_blocked, board_width)
+    return _flood_fill_dynamic(food_pos, len(my_body), board_width, board_height, future_grid)
+
 
+def _count_threats_near(food_pos, threat_heads, my_distance):
+    """Count threats near food position
 
-def _count_threats_near(food_pos, opponents, my_length, my_head):
-    """Count threats near food position"""
+    threat_heads are the heads of opponents at least as long as us, and my_distance
+    is our head's distance to the food.
+    """
     threat_count = 0.0
-    my_distance = _manhattan_distance(my_head, food_pos)
+    food_x, food_y = food_pos
 
-    for opponent in opponents:
-        opp_head = opponent['body'][0]
-        opp_distance = _manhattan_distance(opp_head, food_pos)
-        opp_length = len(opponent['body'])
+    for opp_x, opp_y in threat_heads:
+        opp_distance = abs(opp_x - food_x) + abs(opp_y - food_y)
 
-        if opp_distance <= my_distance and opp_length >= my_length:
+        if opp_distance <= my_distance:
             threat_count += 10.0 / (opp_distance + 1)
 
     return threat_count
@@ -650,28 +651,33 @@ def _count_threats_near(food_pos, opponents, my_length, my_head):
 
 def _predict_opponent_next_moves(opponent, board_width, board_height, depth=2):
     """Predict opponent's next 2 positions"""
-    opponent_head = opponent['body'][0]
-    opponent_body = opponent['body']
+    opponent_head = opponent[0]
+    opponent_body = opponent
     predicted_positions = []
     first_step_positions = []
+    # Body cells the opponent can't enter on its first and second step
+    current_body = set(opponent_body[:-1])
+    trailing_body = set(opponent_body[:-2])
 
-    for move1 in ["up", "down", "left", "right"]:
-        pos1 = _get_next_position(opponent_head, move1)
+    head_x, head_y = opponent_head
+    for dx1, dy1 in MOVE_DELTA.values():
+        pos1 = (head_x + dx1, head_y + dy1)
         if not _is_in_bounds(pos1, board_width, board_height):
             continue
-        if _is_collision_with_body(pos1, opponent_body[:-1]):
+        if pos1 in current_body:
             continue
         predicted_positions.append(pos1)
         first_step_positions.append(pos1)
 
     if depth >= 2:
         for pos1 in first_step_positions:
-            for move2 in ["up", "down", "left", "right"]:
-                pos2 = _get_next_position(pos1, move2)
+            x1, y1 = pos1
+            for dx2, dy2 in MOVE_DELTA.values():
+                pos2 = (x1 + dx2, y1 + dy2)
                 if not _is_in_bounds(pos2, board_width, board_height):
                     continue
-                future_body = [pos1] + opponent_body[:-2]
-                if _is_collision_with_body(pos2, future_body):
+                # After the first step the body is [pos1] + opponent_body[:-2]
+                if pos2 == pos1 or pos2 in trailing_body:
                     continue
                 predicted_positions.append(pos2)
 
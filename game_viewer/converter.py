@@ -1,6 +1,8 @@
 import json
 from pathlib import Path
 
+from eval import json_utils
+
 
 class GameLogConverter:
     def __init__(self, games_dir=None):
@@ -15,29 +17,27 @@ class GameLogConverter:
 
     def _convert_file_to_battlesnake_format(self, game_file, game_id):
         """Internal method to convert a game file to battlesnake format"""
-        with open(game_file, "r") as f:
-            lines = [line.strip() for line in f if line.strip()]
-
-            # First line should be game metadata
-            game_metadata = None
-            if lines:
-                try:
-                    first_line = json.loads(lines[0])
-                    if "ruleset" in first_line and "id" in first_line:
-                        game_metadata = first_line
-                except json.JSONDecodeError:
-                    pass
-
-            # Parse turn data
-            turns = []
-            for line in lines:
-                try:
-                    turn_data = json.loads(line)
-                    # Only include lines that have the expected structure
-                    if "board" in turn_data and "turn" in turn_data:
-                        turns.append(turn_data)
-                except json.JSONDecodeError:
-                    continue
+        with open(game_file, "rb") as f:
+            lines = f.read().splitlines()
+
+        # Parse each non-empty line once; unparseable lines are kept as None so the
+        # first line stays first
+        parsed = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                parsed.append(json_utils.loads(line))
+            except json.JSONDecodeError:
+                parsed.append(None)
+
+        # First line should be game metadata
+        game_metadata = None
+        if parsed and parsed[0] is not None and "ruleset" in parsed[0] and "id" in parsed[0]:
+            game_metadata = parsed[0]
+
+        # Only include lines that have the expected turn structure
+        turns = [data for data in parsed if data is not None and "board" in data and "turn" in data]
 
         if not turns:
             raise ValueError(f"No valid game data found in {game_file}")
@@ -74,17 +74,19 @@ class GameLogConverter:
 
         battlesnake_data = {"game": battlesnake_game, "frames": []}
 
+        frames = battlesnake_data["frames"]
+        convert_snakes = self._convert_snakes
         for turn in turns:
+            board = turn["board"]
+            turn_number = turn["turn"]
             # Convert food and hazards coordinates to PascalCase
-            food_points = [{"X": point["x"], "Y": point["y"]} for point in turn["board"]["food"]]
-            hazard_points = [
-                {"X": point["x"], "Y": point["y"]} for point in turn["board"]["hazards"]
-            ]
+            food_points = [{"X": point["x"], "Y": point["y"]} for point in board["food"]]
+            hazard_points = [{"X": point["x"], "Y": point["y"]} for point in board["hazards"]]
 
-            battlesnake_data["frames"].append(
+            frames.append(
                 {
-                    "Turn": turn["turn"],
-                    "Snakes": self._convert_snakes(turn["board"]["snakes"], turn["turn"]),
+                    "Turn": turn_number,
+                    "Snakes": convert_snakes(board["snakes"], turn_number),
                     "Food": food_points,
                     "Hazards": hazard_points,
                 }
@@ -95,16 +97,17 @@ class GameLogConverter:
     def _convert_snakes(self, snakes, turn_number=0):
         converted_snakes = []
         for snake in snakes:
+            body = snake["body"]
+            health = snake["health"]
+            customizations = snake.get("customizations") or {}
             # Convert body coordinates to PascalCase
-            body_points = []
-            for point in snake["body"]:
-                body_points.append({"X": point["x"], "Y": point["y"]})
+            body_points = [{"X": point["x"], "Y": point["y"]} for point in body]
 
             # Head is the first body point
 
             # Check if snake is eliminated (health 0 or empty body)
             death = None
-            if snake["health"] <= 0 or len(snake["body"]) == 0:
+            if health <= 0 or not body:
                 death = {
                     "Cause": "snake-collision",  # Default cause
                     "Turn": turn_number,
@@ -116,10 +119,10 @@ class GameLogConverter:
                     "ID": snake["id"],
                     "Name": snake["name"],
                     "Body": body_points,
-                    "Health": snake["health"],
-                    "Color": snake.get("customizations", {}).get("color", "#FF0000"),
-                    "HeadType": snake.get("customizations", {}).get("head", "default"),
-                    "TailType": snake.get("customizations", {}).get("tail", "default"),
+                    "Health": health,
+                    "Color": customizations.get("color", "#FF0000"),
+                    "HeadType": customizations.get("head", "default"),
+                    "TailType": customizations.get("tail", "default"),
                     "Latency": str(snake.get("latency", "0")),
                     "Shout": snake.get("shout", ""),
                     "Squad": snake.get("squad", ""),
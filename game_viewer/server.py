@@ -1,12 +1,39 @@
-from flask import Flask, render_template, jsonify
+from flask import Flask, current_app, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_sock import Sock
+from collections import OrderedDict
 from pathlib import Path
-import json
+import hashlib
+import os
+import threading
 import time
+from eval import json_utils
 from game_viewer.converter import GameLogConverter
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson when it is installed"""
+
+    # Keep responses compact even when the app runs in debug mode
+    compact = True
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return json_utils.dumps(obj, sort_keys=self.sort_keys).decode()
+
+    def response(self, *args, **kwargs):
+        # The base class always passes separators/indent to dumps(), which would route
+        # every jsonify() through the stdlib fallback above
+        if args and kwargs:
+            raise TypeError("jsonify() behavior undefined when passed both args and kwargs")
+        obj = args[0] if len(args) == 1 else args or kwargs or None
+        return current_app.response_class(json_utils.dumps(obj, sort_keys=self.sort_keys) + b"\n", mimetype=self.mimetype)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 sock = Sock(app)
 
@@ -19,6 +46,141 @@ default_games_dir = project_dir / "tournaments"
 converter = GameLogConverter(default_games_dir)
 
 
+def _scan_dirs(path):
+    """Yield a DirEntry for each subdirectory of path; DirEntry caches the file type, so no extra stat"""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield entry
+
+
+def _scan_game_files(path):
+    """Yield a DirEntry for each *.json file in path, or nothing if path does not exist"""
+    try:
+        it = os.scandir(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    with it:
+        for entry in it:
+            if entry.name.endswith(".json") and entry.is_file():
+                yield entry
+
+
+# Listings are cached per games/ directory and keyed on its mtime. Adding or removing a game
+# changes only that directory's mtime, so a new game rescans one matchup instead of the tree
+_game_stems_cache = {}  # games dir path -> (st_mtime_ns, scanned_at_ns, tuple of game ids)
+_trueskill_cache = {}  # results file path -> (st_mtime_ns, parsed results)
+# Serialized response bodies per route, with the signature of the listings they were built from
+_response_cache = {}
+# Directory mtimes are only as fine as the filesystem clock tick; a listing taken this soon after
+# the last change is rescanned next time, in case another change landed within the same tick
+_RACY_MTIME_NS = 1_000_000_000
+
+
+def _game_stems(games_path):
+    """Return the ids of the *.json games in games_path, rescanning only when the directory changed"""
+    try:
+        mtime = os.stat(games_path).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        return ()
+    cached = _game_stems_cache.get(games_path)
+    if cached is not None and cached[0] == mtime and cached[1] - mtime >= _RACY_MTIME_NS:
+        return cached[2]
+    stems = tuple(entry.name[:-len(".json")] for entry in _scan_game_files(games_path))
+    _game_stems_cache[games_path] = (mtime, time.time_ns(), stems)
+    return stems
+
+
+def _scan_tournaments(games_dir):
+    """Return (session_dir, [(matchup_id, game ids)]) for each round-robin tournament in games_dir"""
+    tournaments = []
+    for session_dir in _scan_dirs(games_dir):
+        # Only handle round-robin tournaments, which have matchups inside
+        if session_dir.name.startswith("round_robin_"):
+            matchups = [
+                (matchup_dir.name, _game_stems(os.path.join(matchup_dir.path, "games")))
+                for matchup_dir in _scan_dirs(session_dir.path)
+            ]
+            tournaments.append((session_dir, matchups))
+    return tournaments
+
+
+def _load_trueskill(session_path):
+    """Return a tournament's parsed TrueSkill results, or None; reparsed only when the file changes"""
+    trueskill_file = os.path.join(session_path, "trueskill_results.json")
+    try:
+        mtime = os.stat(trueskill_file).st_mtime_ns
+    except OSError:
+        return None
+    cached = _trueskill_cache.get(trueskill_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        with open(trueskill_file, "rb") as f:
+            trueskill_data = json_utils.loads(f.read())
+    except Exception:
+        trueskill_data = None
+    _trueskill_cache[trueskill_file] = (mtime, trueskill_data)
+    return trueskill_data
+
+
+def _conditional(response, etag):
+    """Tag response with etag and turn it into a 304 when the client already has that version"""
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
+def _cached_response(route, signature):
+    """Return a response with route's cached body if it was built from the same signature, else None"""
+    cached = _response_cache.get(route)
+    if cached is not None and cached[0] == signature:
+        return _conditional(app.response_class(cached[1], mimetype="application/json"), cached[2])
+    return None
+
+
+def _store_response(route, signature, response):
+    """
+    Cache response's serialized body so identical requests skip rebuilding and encoding it. The
+    body's ETag lets polling clients revalidate with If-None-Match and get an empty 304
+    """
+    body = response.get_data()
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    _response_cache[route] = (signature, body, etag)
+    return _conditional(response, etag)
+
+
+# Serialized WebSocket events of recently viewed games, most recent last
+GAME_EVENTS_CACHE_SIZE = 64
+_game_events_cache = OrderedDict()  # game file path -> (st_mtime_ns, scanned_at_ns, frame events, game_end event)
+_game_events_lock = threading.Lock()
+
+
+def _game_events(tournament_id, matchup_id, game_id):
+    """
+    Return a game's serialized frame events and game_end event. Replays are immutable once
+    written, so each file version is converted and serialized once and shared by all viewers.
+    """
+    game_file = os.path.join(converter.games_dir, tournament_id, matchup_id, "games", f"{game_id}.json")
+    mtime = os.stat(game_file).st_mtime_ns
+    with _game_events_lock:
+        cached = _game_events_cache.get(game_file)
+        if cached is not None and cached[0] == mtime and cached[1] - mtime >= _RACY_MTIME_NS:
+            _game_events_cache.move_to_end(game_file)
+            return cached[2], cached[3]
+
+    scanned_at = time.time_ns()
+    battlesnake_data = converter.convert_to_battlesnake_format_tournament(tournament_id, matchup_id, game_id)
+    frame_events = tuple(app.json.dumps({"Type": "frame", "Data": frame}) for frame in battlesnake_data["frames"])
+    game_end_event = app.json.dumps({"Type": "game_end", "Data": {"game": battlesnake_data["game"]}})
+
+    with _game_events_lock:
+        _game_events_cache[game_file] = (mtime, scanned_at, frame_events, game_end_event)
+        _game_events_cache.move_to_end(game_file)
+        if len(_game_events_cache) > GAME_EVENTS_CACHE_SIZE:
+            _game_events_cache.popitem(last=False)
+    return frame_events, game_end_event
+
+
 @app.route("/")
 def index():
     return render_template("index.html")
@@ -30,25 +192,23 @@ def list_all_games():
     all_games = []
 
     try:
-        for session_dir in converter.games_dir.iterdir():
-            if session_dir.is_dir():
-                session_id = session_dir.name
-                # Only handle round-robin tournaments
-                if session_id.startswith("round_robin_"):
-                    # It's a tournament with matchups inside
-                    for matchup_dir in session_dir.iterdir():
-                        if matchup_dir.is_dir():
-                            games_subdir = matchup_dir / "games"
-                            if games_subdir.exists():
-                                for game_file in games_subdir.glob("*.json"):
-                                    game_stem = game_file.stem
-                                    # Format: tournament_id/matchup_id_game_X
-                                    combined_id = f"{session_id}/{matchup_dir.name}_{game_stem}"
-                                    all_games.append({"ID": combined_id, "Status": "complete"})
+        tournaments = _scan_tournaments(converter.games_dir)
     except Exception as e:
         print(f"Error listing games: {e}")
         return jsonify({"Games": []})
 
+    signature = [(session_dir.name, matchups) for session_dir, matchups in tournaments]
+    response = _cached_response("games", signature)
+    if response is not None:
+        return response
+
+    for session_id, matchups in signature:
+        for matchup_id, game_stems in matchups:
+            for game_stem in game_stems:
+                # Format: tournament_id/matchup_id_game_X
+                combined_id = f"{session_id}/{matchup_id}_{game_stem}"
+                all_games.append({"ID": combined_id, "Status": "complete"})
+
     # Smart sorting: by session, then by game number
     def sort_game_key(game):
         game_id = game["ID"]
@@ -65,7 +225,7 @@ def list_all_games():
     all_games.sort(key=sort_game_key)
 
     print(f"Listed {len(all_games)} total games across all tournaments")
-    return jsonify({"Games": all_games})
+    return _store_response("games", signature, jsonify({"Games": all_games}))
 
 
 @app.route("/api/tournaments")
@@ -76,55 +236,46 @@ def list_tournaments():
     if not default_games_dir.exists():
         return jsonify({"error": f"Games directory not found: {default_games_dir}"}), 404
 
-    for session_dir in default_games_dir.iterdir():
-        if session_dir.is_dir():
-            session_name = session_dir.name
-
-            if session_name.startswith("round_robin_"):
-                # It's a round-robin tournament
-                matchup_count = 0
-                total_games = 0
-                matchups = []
-
-                # Load TrueSkill results if available
-                trueskill_file = session_dir / "trueskill_results.json"
-                trueskill_data = None
-                if trueskill_file.exists():
-                    try:
-                        with open(trueskill_file, "r") as f:
-                            trueskill_data = json.load(f)
-                    except Exception:
-                        pass
-
-                # Count matchups and games
-                for matchup_dir in session_dir.iterdir():
-                    if matchup_dir.is_dir():
-                        games_subdir = matchup_dir / "games"
-                        if games_subdir.exists():
-                            game_count = len(list(games_subdir.glob("*.json")))
-                            if game_count > 0:
-                                matchups.append(
-                                    {"name": matchup_dir.name, "game_count": game_count}
-                                )
-                                total_games += game_count
-                                matchup_count += 1
-
-                tournaments.append(
-                    {
-                        "id": session_name,
-                        "type": "round_robin",
-                        "matchup_count": matchup_count,
-                        "total_games": total_games,
-                        "matchups": matchups,
-                        "trueskill": trueskill_data,
-                        "path": str(session_dir),
-                    }
+    signature = [
+        (session_dir.path, matchups, _load_trueskill(session_dir.path))
+        for session_dir, matchups in _scan_tournaments(default_games_dir)
+    ]
+    response = _cached_response("tournaments", signature)
+    if response is not None:
+        return response
+
+    for session_path, session_matchups, trueskill_data in signature:
+        # It's a round-robin tournament
+        matchup_count = 0
+        total_games = 0
+        matchups = []
+
+        # Count matchups and games
+        for matchup_id, game_stems in session_matchups:
+            game_count = len(game_stems)
+            if game_count > 0:
+                matchups.append(
+                    {"name": matchup_id, "game_count": game_count}
                 )
+                total_games += game_count
+                matchup_count += 1
+
+        tournaments.append(
+            {
+                "id": os.path.basename(session_path),
+                "type": "round_robin",
+                "matchup_count": matchup_count,
+                "total_games": total_games,
+                "matchups": matchups,
+                "trueskill": trueskill_data,
+                "path": session_path,
+            }
+        )
 
     # Sort tournaments by date (newest first)
     tournaments.sort(key=lambda x: x["id"], reverse=True)
 
-    return jsonify({"tournaments": tournaments})
+    return _store_response("tournaments", signature, jsonify({"tournaments": tournaments}))
 
 
 @app.route("/api/tournaments/<tournament_id>/matchups/<matchup_id>/games")
@@ -136,10 +287,10 @@ def list_matchup_games(tournament_id, matchup_id):
     if not matchup_path.exists():
         return jsonify({"error": f"Matchup not found: {tournament_id}/{matchup_id}"}), 404
 
-    for game_file in matchup_path.glob("*.json"):
+    for game_file in _scan_game_files(matchup_path):
         try:
-            game_id = game_file.stem
-            games.append({"id": game_id, "filename": game_file.name, "path": str(game_file)})
+            game_id = game_file.name[:-len(".json")]
+            games.append({"id": game_id, "filename": game_file.name, "path": game_file.path})
         except Exception as e:
             print(f"Error processing {game_file}: {e}")
             continue
@@ -206,28 +357,21 @@ def get_game_events_ws(ws, game_id):
                     matchup_id = matchup_parts[0]
                     actual_game_id = "game_" + matchup_parts[1]
 
-                    battlesnake_data = converter.convert_to_battlesnake_format_tournament(
-                        tournament_id, matchup_id, actual_game_id
-                    )
+                    frame_events, game_end_event = _game_events(tournament_id, matchup_id, actual_game_id)
 
-                    # Send each frame
-                    for frame in battlesnake_data["frames"]:
-                        event = {"Type": "frame", "Data": frame}
-                        ws.send(json.dumps(event))
-                        time.sleep(0.01)
+                    # Send each frame back to back; the board buffers frames itself, so
+                    # pausing between sends only held the worker thread
+                    for event in frame_events:
+                        ws.send(event)
 
                     # Send game end event
-                    game_end_event = {
-                        "Type": "game_end",
-                        "Data": {"game": battlesnake_data["game"]},
-                    }
-                    ws.send(json.dumps(game_end_event))
+                    ws.send(game_end_event)
                     return
 
         # Game not found
         print(f"ERROR: Game not found: {game_id}")
         error_event = {"Type": "error", "Data": {"error": "Game not found"}}
-        ws.send(json.dumps(error_event))
+        ws.send(app.json.dumps(error_event))
 
     except Exception as e:
         print(f"EXCEPTION in WebSocket handler: {e}")
@@ -237,7 +381,7 @@ def get_game_events_ws(ws, game_id):
 
         try:
             error_event = {"Type": "error", "Data": {"error": str(e)}}
-            ws.send(json.dumps(error_event))
+            ws.send(app.json.dumps(error_event))
         except Exception:
             pass
 
@@ -0,0 +1,44 @@
+"""
+Tests for the game viewer server.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from eval import json_utils
+from game_viewer import server
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    games = tmp_path / "round_robin_1" / "a_vs_b" / "games"
+    games.mkdir(parents=True)
+    (games / "game_1.json").write_text("{}")
+    monkeypatch.setattr(server.converter, "games_dir", tmp_path)
+    monkeypatch.setattr(server, "_response_cache", {})
+    return server.app.test_client()
+
+
+class TestJsonProvider:
+    """Tests for the orjson-backed JSON provider."""
+
+    def test_games_listing_uses_json_utils(self, client):
+        """jsonify responses should be serialized by json_utils.dumps, not the stdlib fallback."""
+        with patch.object(server.json_utils, "dumps", wraps=json_utils.dumps) as dumps:
+            response = client.get("/games")
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/json"
+        assert dumps.call_count == 1
+        assert response.get_json() == {"Games": [{"ID": "round_robin_1/a_vs_b_game_1", "Status": "complete"}]}
+
+    def test_error_responses_use_json_utils(self, client):
+        """Responses built directly with jsonify should take the same path."""
+        with server.app.test_request_context(), patch.object(
+            server.json_utils, "dumps", wraps=json_utils.dumps
+        ) as dumps:
+            response = server.jsonify({"error": "x"})
+
+        assert dumps.call_count == 1
+        assert response.data == b'{"error":"x"}\n'
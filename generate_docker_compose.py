@@ -7,6 +7,9 @@ import json
 import yaml
 import argparse
 
+# libyaml-backed dumper when PyYAML was built with it; the output is the same
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -57,7 +60,7 @@ def generate_docker_compose(
 
     # Write docker-compose file
     with open(output_file, "w") as f:
-        yaml.dump(compose, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(compose, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
 
     print(f"Generated {output_file} with {len(snakes)} snakes:")
     for snake in snakes:
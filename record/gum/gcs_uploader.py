@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """Upload recording data to GCS using pre-signed URLs (no credentials needed)"""
 import json
+import os
+import shutil
+import subprocess
 import tarfile
 import requests
 from pathlib import Path
@@ -8,6 +11,29 @@ from datetime import datetime
 from typing import Dict, Optional
 import tempfile
 
+# Bundles are dominated by JPG/PNG screenshots, which are already entropy-coded and do not
+# shrink further; level 1 still deflates the database and logs at a fraction of level 9's CPU.
+# The bundle stays a .tar.gz so the upload Content-Type and downstream tooling are unchanged
+BUNDLE_COMPRESSLEVEL = 1
+UPLOAD_CHUNK_SIZE = 4 << 20  # 4 MiB
+
+
+# _LargeChunkReader and the pigz path of _write_tarball mirror eval/snapshot_uploader.py in the
+# starter repo. gum is packaged and installed on its own and cannot import eval, so the two are
+# kept as separate copies; change both together.
+class _LargeChunkReader:
+    """Upload body that hands out UPLOAD_CHUNK_SIZE per read() and reports its size for Content-Length"""
+
+    def __init__(self, f, size):
+        self._f = f
+        self._size = size
+
+    def __len__(self):
+        return self._size
+
+    def read(self, _size=-1):
+        return self._f.read(UPLOAD_CHUNK_SIZE)
+
 
 class GCSUploader:
     """Simple uploader for recording data using pre-signed URLs"""
@@ -51,7 +77,6 @@ class GCSUploader:
         data_path = Path(data_dir).expanduser()
         screenshots_dir = data_path / "screenshots"
         actions_db = data_path / "actions.db"
-        ai_sessions_dir = screenshots_dir / "ai_sessions"  # AI logs are in screenshots/ai_sessions/
 
         # Validate
         if not screenshots_dir.exists() or not actions_db.exists():
@@ -65,16 +90,23 @@ class GCSUploader:
         tarball_name = f"{self.user_id}_session_{timestamp}.tar.gz"
         tarball_path = temp_dir / tarball_name
 
-        with tarfile.open(tarball_path, "w:gz") as tar:
-            tar.add(screenshots_dir, arcname="screenshots")
-            tar.add(actions_db, arcname="actions.db")
-            # Add AI session logs if they exist
-            if ai_sessions_dir.exists():
-                tar.add(ai_sessions_dir, arcname="screenshots/ai_sessions")
+        # Count files for metadata while they are added, instead of listing the directories again
+        screenshot_count = 0
+        ai_log_count = 0
 
-        # Count files for metadata
-        screenshot_files = list(screenshots_dir.glob("*.jpg")) + list(screenshots_dir.glob("*.png"))
-        ai_log_files = list(ai_sessions_dir.glob("*.log")) if ai_sessions_dir.exists() else []
+        def count_member(tarinfo):
+            nonlocal screenshot_count, ai_log_count
+            if tarinfo.isfile():
+                parent, _, name = tarinfo.name.rpartition("/")
+                if parent == "screenshots" and name.endswith((".jpg", ".png")):
+                    screenshot_count += 1
+                elif parent == "screenshots/ai_sessions" and name.endswith(".log"):
+                    ai_log_count += 1
+            return tarinfo
+
+        # AI session logs in screenshots/ai_sessions/ are included by adding screenshots/
+        members = [(screenshots_dir, "screenshots"), (actions_db, "actions.db")]
+        self._write_tarball(tarball_path, members, filter=count_member)
 
         # Create metadata
         metadata = {
@@ -83,8 +115,8 @@ class GCSUploader:
             "session_id": session_id,
             "timestamp": datetime.now().isoformat(),
             "timestamp_unix": timestamp,
-            "screenshot_count": len(screenshot_files),
-            "ai_session_log_count": len(ai_log_files),
+            "screenshot_count": screenshot_count,
+            "ai_session_log_count": ai_log_count,
             "bundle_size_mb": tarball_path.stat().st_size / (1024 * 1024),
             "storage": "gcs_only",
         }
@@ -95,6 +127,32 @@ class GCSUploader:
 
         return tarball_path, metadata_path
 
+    def _write_tarball(self, tarball_path: Path, members: list[tuple[Path, str]], filter=None) -> None:
+        """
+        Write (path, arcname) members to a gzipped tarball, using parallel pigz when it is installed.
+        filter is passed through to TarFile.add.
+        """
+        pigz = shutil.which("pigz")
+        if pigz is None:
+            with tarfile.open(tarball_path, "w:gz", compresslevel=BUNDLE_COMPRESSLEVEL) as tar:
+                for path, arcname in members:
+                    tar.add(path, arcname=arcname, filter=filter)
+            return
+
+        # Stream an uncompressed tar into pigz, which deflates across all cores
+        cmd = [pigz, f"-{BUNDLE_COMPRESSLEVEL}", "-p", str(os.cpu_count() or 1)]
+        with open(tarball_path, "wb") as out:
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=out)
+            try:
+                with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                    for path, arcname in members:
+                        tar.add(path, arcname=arcname, filter=filter)
+            finally:
+                proc.stdin.close()
+                returncode = proc.wait()
+        if returncode != 0:
+            raise RuntimeError(f"pigz exited with status {returncode}")
+
     def upload(self, tarball_path: Path, metadata_path: Path) -> Dict:
         """Upload using pre-signed URLs"""
         if not self.enabled:
@@ -112,25 +170,10 @@ class GCSUploader:
             slot = session_urls[self._session_slot]
             print(f"Using slot {self._session_slot} for {self._stage} stage")
 
-            # Upload tarball
-            with open(tarball_path, "rb") as f:
-                response = requests.put(
-                    slot["tarball_url"],
-                    data=f,
-                    headers={"Content-Type": "application/gzip"},
-                    timeout=1200,
-                )
-                response.raise_for_status()
-
-            # Upload metadata
-            with open(metadata_path, "rb") as f:
-                response = requests.put(
-                    slot["metadata_url"],
-                    data=f,
-                    headers={"Content-Type": "application/json"},
-                    timeout=30,
-                )
-                response.raise_for_status()
+            # Metadata goes up only after the bundle it describes, so a failed tarball
+            # upload never leaves metadata pointing at a missing bundle
+            self._put(slot["tarball_url"], tarball_path, "application/gzip", 1200)
+            self._put(slot["metadata_url"], metadata_path, "application/json", 30)
 
             return {"status": "success", "slot": slot["slot"]}
 
@@ -164,6 +207,18 @@ class GCSUploader:
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
+    @staticmethod
+    def _put(url: str, path: Path, content_type: str, timeout: int) -> None:
+        """PUT a file to a pre-signed URL, raising for an error status"""
+        with open(path, "rb") as f:
+            response = requests.put(
+                url,
+                data=_LargeChunkReader(f, path.stat().st_size),
+                headers={"Content-Type": content_type},
+                timeout=timeout,
+            )
+            response.raise_for_status()
+
     def upload_recording(self, data_dir: str) -> Dict:
         """Create bundle and upload in one call"""
         if not self.enabled:
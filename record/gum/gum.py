@@ -7,7 +7,7 @@ from typing import Callable
 
 from .models import Observation, init_db
 from .observers import Observer
-from .schemas import Update
+from .schemas import Update, UpdateBatch
 
 
 class gum:
@@ -108,21 +108,24 @@ class gum:
     async def _handle_audit(self, obs: Observation) -> bool:
         return False
 
-    async def _default_handler(self, observer: Observer, update: Update) -> None:
+    async def _default_handler(self, observer: Observer, update: Update | UpdateBatch) -> None:
         self.logger.info(f"Processing update from {observer.name}")
-        # self.logger.info(f"Content ({update.content_type}): {update.content[:10]}")
-        self.logger.info(f"Content ({update.content_type}): {update.content}")
+        # A batch is stored in a single transaction
+        updates = update.updates if isinstance(update, UpdateBatch) else [update]
         async with self._session() as session:
-            observation = Observation(
-                observer_name=observer.name,
-                content=update.content,
-                content_type=update.content_type,
-            )
-
-            if await self._handle_audit(observation):
-                return
-
-            session.add(observation)
+            for update in updates:
+                # self.logger.info(f"Content ({update.content_type}): {update.content[:10]}")
+                self.logger.info(f"Content ({update.content_type}): {update.content}")
+                observation = Observation(
+                    observer_name=observer.name,
+                    content=update.content,
+                    content_type=update.content_type,
+                )
+
+                if await self._handle_audit(observation):
+                    continue
+
+                session.add(observation)
             await session.flush()
 
     @asynccontextmanager
@@ -15,12 +15,13 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 from pathlib import Path
 
 from .observer import Observer
-from ..schemas import Update
+from ..schemas import Update, UpdateBatch
 from ..platform import get_active_app_detector, get_clipboard
 
 
@@ -48,6 +49,11 @@ class AIActivityDetector(Observer):
     # Browsers to monitor for web AI tools
     BROWSERS = ["Google Chrome", "Safari", "Brave Browser", "Firefox", "Microsoft Edge"]
 
+    # AI_TOOLS keywords matched against the app name (non-browser apps) and against the
+    # browser tab title, in the order they are checked
+    DESKTOP_KEYWORDS = ("cursor", "claude")
+    BROWSER_KEYWORDS = ("chatgpt", "openai", "claude.ai", "gemini", "copilot")
+
     def __init__(
         self,
         screenshots_dir: str = "data/screenshots",
@@ -81,16 +87,27 @@ class AIActivityDetector(Observer):
         # Platform adapters
         self._app_detector = get_active_app_detector()
         self._clipboard = get_clipboard()
+        # Blocking platform calls run on one long-lived thread; the adapters serialize on OS
+        # locks anyway, so a single worker avoids per-call executor overhead
+        self._thread_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AIActivity")
+
+        # Lookups for the poll loop, resolved once: (keyword, tool name) pairs and a browser set
+        self._desktop_tools = [(keyword, self.AI_TOOLS[keyword]) for keyword in self.DESKTOP_KEYWORDS]
+        self._browser_tools = [(keyword, self.AI_TOOLS[keyword]) for keyword in self.BROWSER_KEYWORDS]
+        self._browsers = frozenset(self.BROWSERS)
 
         # State tracking
         self._current_ai_tool: Optional[str] = None
         self._last_clipboard: str = ""
+        self._last_clipboard_change: Optional[int] = None
         self._ai_session_start: Optional[float] = None
         self._ai_session_start_time: Optional[str] = None  # ISO timestamp
         self._current_window_title: Optional[str] = None
         self._current_url: Optional[str] = None
         self._last_window_check: float = 0
         self._window_check_interval: float = 2.0  # Check window title every 2 seconds
+        # Updates produced during one poll, enqueued together at the end of it
+        self._pending: list[Update] = []
 
         super().__init__()
 
@@ -140,35 +157,49 @@ class AIActivityDetector(Observer):
             except Exception as e:
                 log.error(f"Error in AI activity detector: {e}", exc_info=True)
 
+            await self._flush_pending()
             await asyncio.sleep(self.poll_interval)
 
+    async def _flush_pending(self):
+        """Enqueue this poll's updates as one item, so they are stored in one transaction."""
+        if not self._pending:
+            return
+        if len(self._pending) == 1:
+            await self.update_queue.put(self._pending[0])
+        else:
+            await self.update_queue.put(UpdateBatch(updates=self._pending))
+        self._pending = []
+
+    async def _run_in_thread(self, func, *args):
+        """Run a blocking platform call on the detector's thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._thread_pool, func, *args)
+
+    async def stop(self) -> None:
+        """Stop the detector and its platform thread."""
+        await super().stop()
+        self._thread_pool.shutdown(wait=False)
+
     async def _detect_ai_tool(self, app_name: str) -> Optional[str]:
         """Detect if current window is an AI tool."""
         app_lower = app_name.lower()
 
         # Check desktop apps first (non-browser apps)
-        # Desktop app keywords that are NOT browser-based
-        desktop_keywords = ["cursor", "claude"]
-        for keyword in desktop_keywords:
+        for keyword, tool_name in self._desktop_tools:
             if keyword in app_lower:
-                tool_name = self.AI_TOOLS.get(keyword)
-                if tool_name:
-                    return tool_name
+                return tool_name
 
         # Check if it's a browser
-        if app_name in self.BROWSERS:
+        if app_name in self._browsers:
             # Get browser tab title
-            # Run in thread pool to avoid blocking async loop
-            tab_title = await asyncio.to_thread(self._app_detector.get_browser_tab_title, app_name)
+            # Run in thread to avoid blocking async loop
+            tab_title = await self._run_in_thread(self._app_detector.get_browser_tab_title, app_name)
             if tab_title:
                 tab_lower = tab_title.lower()
                 # Check browser-based AI tools
-                browser_keywords = ["chatgpt", "openai", "claude.ai", "gemini", "copilot"]
-                for keyword in browser_keywords:
+                for keyword, tool_name in self._browser_tools:
                     if keyword in tab_lower:
-                        tool_name = self.AI_TOOLS.get(keyword)
-                        if tool_name:
-                            return tool_name
+                        return tool_name
 
         return None
 
@@ -179,15 +210,14 @@ class AIActivityDetector(Observer):
             url = None
 
             # Get window title and URL based on app type
-            if app_name in self.BROWSERS:
-                # Browser - get tab title and URL
-                window_title = await asyncio.to_thread(
-                    self._app_detector.get_browser_tab_title, app_name
+            if app_name in self._browsers:
+                # Browser - get tab title and URL in one call
+                window_title, url = await self._run_in_thread(
+                    self._app_detector.get_browser_tab_info, app_name
                 )
-                url = await asyncio.to_thread(self._app_detector.get_browser_tab_url, app_name)
             else:
                 # Desktop app - get window title
-                window_title = await asyncio.to_thread(
+                window_title = await self._run_in_thread(
                     self._app_detector.get_active_window_title, app_name
                 )
 
@@ -203,7 +233,7 @@ class AIActivityDetector(Observer):
                 if url:
                     content_parts.append(f"URL: {url}")
 
-                await self.update_queue.put(
+                self._pending.append(
                     Update(content="\n".join(content_parts), content_type="ai_activity")
                 )
 
@@ -222,7 +252,7 @@ class AIActivityDetector(Observer):
         self._current_window_title = None
         self._current_url = None
 
-        await self.update_queue.put(
+        self._pending.append(
             Update(content=f"Activated AI tool: {tool_name}", content_type="ai_activity")
         )
         log.info(f"User switched to {tool_name}")
@@ -243,7 +273,7 @@ class AIActivityDetector(Observer):
             if self._current_url:
                 summary_parts.append(f"Last URL: {self._current_url}")
 
-            await self.update_queue.put(
+            self._pending.append(
                 Update(content="\n".join(summary_parts), content_type="ai_activity")
             )
             log.info(f"User left {self._current_ai_tool} after {duration:.1f}s")
@@ -256,8 +286,19 @@ class AIActivityDetector(Observer):
     async def _check_clipboard(self, log):
         """Check if clipboard content changed (potential copy from AI)."""
         try:
-            # Run in thread pool as clipboard access might be slow/blocking
-            clipboard_content = await asyncio.to_thread(self._clipboard.get_text)
+            # Skip fetching the (possibly large) text while the platform reports no change;
+            # read the counter first so a copy during the fetch is caught on the next poll
+            change_count = self._clipboard.get_change_count()
+            if change_count is not None and change_count == self._last_clipboard_change:
+                return
+
+            # Run in thread as clipboard access might be slow/blocking
+            clipboard_content = await self._run_in_thread(self._clipboard.get_text)
+            # Only record the counter once the text was read; a failed read (e.g. the copying
+            # app still holds the clipboard on Windows) is retried on the next poll
+            if clipboard_content is None:
+                return
+            self._last_clipboard_change = change_count
 
             if clipboard_content and clipboard_content != self._last_clipboard:
                 # Content changed while AI tool is active
@@ -265,7 +306,7 @@ class AIActivityDetector(Observer):
                 if len(clipboard_content) > 200:
                     content_preview += "..."
 
-                await self.update_queue.put(
+                self._pending.append(
                     Update(
                         content=f"[COPIED from {self._current_ai_tool}]:\n{clipboard_content}",
                         content_type="ai_clipboard",
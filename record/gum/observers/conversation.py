@@ -8,12 +8,21 @@ event-based capture of conversation content.
 
 from __future__ import annotations
 import asyncio
+import functools
 import logging
 from pathlib import Path
 from typing import Optional
 
 from .observer import Observer
 
+logger = logging.getLogger("ConversationObserver")
+
+
+@functools.lru_cache(maxsize=None)
+def _expand_path(path: str) -> Path:
+    """Expand ~ once per distinct path string."""
+    return Path(path).expanduser()
+
 
 class ConversationObserver(Observer):
     """
@@ -23,12 +32,16 @@ class ConversationObserver(Observer):
     captures them for later analysis.
     """
 
+    IDLE_STREAK_BEFORE_BACKOFF = 4
+
     def __init__(
         self,
         screenshots_dir: str = "data/screenshots",
         data_directory: str = "data",
         poll_interval: float = 1.0,
         debug: bool = False,
+        min_poll_interval: float = 0.05,
+        max_poll_interval: float = 5.0,
     ):
         """
         Initialize conversation observer.
@@ -40,43 +53,121 @@ class ConversationObserver(Observer):
         data_directory : str
             Directory for conversation logs
         poll_interval : float
-            How often to check for conversation events (seconds)
+            Initial interval between checks for sources that do not call notify() (seconds)
         debug : bool
             Enable debug logging
+        min_poll_interval : float
+            Shortest interval the check backs off to while events keep arriving (seconds)
+        max_poll_interval : float
+            Longest interval the check backs off to while idle (seconds)
         """
-        self.screenshots_dir = Path(screenshots_dir).expanduser()
-        self.data_dir = Path(data_directory).expanduser()
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.screenshots_dir = _expand_path(screenshots_dir)
+        self.data_dir = _expand_path(data_directory)
+        if not self.data_dir.is_dir():
+            self.data_dir.mkdir(parents=True, exist_ok=True)
         self.poll_interval = poll_interval
         self.debug = debug
 
         # State tracking
         self._last_conversation_hash: Optional[str] = None
 
+        # Set by producers through notify(), and by stop() to end the worker. asyncio.Event is not
+        # thread-safe, so notify() hands the set() to the loop the observer was created on
+        self._loop = asyncio.get_running_loop()
+        self._new_event = asyncio.Event()
+        self._stop_event = asyncio.Event()
+
+        # Adaptive check interval: halved on every wakeup that finds work, doubled after
+        # IDLE_STREAK_BEFORE_BACKOFF consecutive idle checks
+        self._min_interval = min_poll_interval
+        self._max_interval = max_poll_interval
+        self._cur_interval = poll_interval
+        self._idle_streak = 0
+
+        # Registered event sources; with none the worker waits on _has_sources instead of checking
+        self._active_sources = 0
+        self._has_sources = asyncio.Event()
+
         super().__init__()
 
+    def add_source(self) -> None:
+        """Register an event source (e.g. a clipboard hook), enabling conversation checks."""
+        self._active_sources += 1
+        self._has_sources.set()
+
+    def remove_source(self) -> None:
+        """Unregister an event source; checks pause once none are left."""
+        if self._active_sources == 0:
+            raise ValueError("remove_source() called without a matching add_source()")
+        self._active_sources -= 1
+        if self._active_sources == 0:
+            self._has_sources.clear()
+
+    def notify(self) -> None:
+        """Wake the worker because new conversation data is available; safe to call from any thread."""
+        if not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._new_event.set)
+
+    async def stop(self) -> None:
+        """Wake the worker wherever it waits so it exits, then stop it."""
+        self._stop_event.set()
+        self._new_event.set()
+        self._has_sources.set()
+        await super().stop()
+
     async def _worker(self):
         """Main monitoring loop."""
-        log = logging.getLogger("ConversationObserver")
         if self.debug:
-            log.setLevel(logging.INFO)
+            logger.setLevel(logging.INFO)
         else:
-            log.addHandler(logging.NullHandler())
+            logger.addHandler(logging.NullHandler())
 
-        log.info("Conversation Observer started")
+        logger.info("Conversation Observer started")
 
         while self._running:
+            if self._active_sources == 0:
+                # Nothing can produce conversation events, so skip checking until a source is added
+                await self._has_sources.wait()
+                if self._stop_event.is_set():
+                    break
+                continue
+
+            # Sleep until a producer has new data, or the adaptive interval runs out
             try:
-                # Placeholder for conversation monitoring logic
-                # This can be extended to:
-                # - Monitor clipboard for conversation content
-                # - Detect conversation state changes
-                # - Capture conversation metadata
-                pass
-
-            except Exception as e:
-                log.error(f"Error in conversation observer: {e}", exc_info=True)
+                await asyncio.wait_for(self._new_event.wait(), self._cur_interval)
+                found_work = True
+            except asyncio.TimeoutError:
+                found_work = False
+            self._new_event.clear()
+            if self._stop_event.is_set():
+                break
 
-            await asyncio.sleep(self.poll_interval)
+            try:
+                found_work = await self._check_conversation() or found_work
 
-        log.info("Conversation Observer stopped")
+            except Exception as e:
+                logger.error("Error in conversation observer: %s", e, exc_info=True)
+
+            self._adjust_interval(found_work)
+
+        logger.info("Conversation Observer stopped")
+
+    async def _check_conversation(self) -> bool:
+        """Check for conversation events; returns whether anything was found."""
+        # Placeholder for conversation monitoring logic
+        # This can be extended to:
+        # - Monitor clipboard for conversation content
+        # - Detect conversation state changes
+        # - Capture conversation metadata
+        return False
+
+    def _adjust_interval(self, found_work: bool) -> None:
+        """Check sooner while events keep arriving, and back off while idle."""
+        if found_work:
+            self._idle_streak = 0
+            self._cur_interval = max(self._min_interval, self._cur_interval / 2)
+        else:
+            self._idle_streak += 1
+            if self._idle_streak >= self.IDLE_STREAK_BEFORE_BACKOFF:
+                self._idle_streak = 0
+                self._cur_interval = min(self._max_interval, self._cur_interval * 2)
@@ -1,8 +1,36 @@
+import asyncio
 import logging
+import sys
+import time
 from typing import Optional, Callable, Tuple
 
+import numpy as np
+
 logger = logging.getLogger("InputObserver")
 
+# Pointer samples kept for get_recent_positions(); a power of two so the ring index is a mask
+POSITION_HISTORY = 1024
+
+# (mouse, keyboard) pynput modules once imported, False if the import failed
+_pynput = None
+
+
+def _load_pynput():
+    """Import pynput on first use and reuse the result for every later listener."""
+    global _pynput
+    if _pynput is None:
+        try:
+            from pynput import mouse, keyboard
+
+            _pynput = (mouse, keyboard)
+        except ImportError:
+            logger.warning("pynput not found. Input monitoring disabled.")
+            _pynput = False
+        except Exception as e:
+            logger.warning(f"Failed to initialize input libraries: {e}")
+            _pynput = False
+    return _pynput or None
+
 
 class InputListener:
     """
@@ -14,45 +42,90 @@ class InputListener:
         on_click: Optional[Callable] = None,
         on_scroll: Optional[Callable] = None,
         on_press: Optional[Callable] = None,
+        on_key: Optional[Callable] = None,
         suppress: bool = False,
+        motion_downsample_n: int = 1,
+        motion_min_dt: float = 0.0,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        queue_maxsize: int = 0,
+        unified_hook: bool = False,
     ):
         self.on_click = on_click
         self.on_scroll = on_scroll
         self.on_press = on_press
+        # Called as on_key(key, pressed) for both transitions from the one keyboard listener
+        self.on_key = on_key
         self.suppress = suppress
+        # High-rate scroll streams are thinned before they reach on_scroll: only every
+        # motion_downsample_n-th event is forwarded, and at most one per motion_min_dt seconds
+        self.motion_downsample_n = motion_downsample_n
+        self.motion_min_dt = motion_min_dt
+        # With a loop, the native hook threads only enqueue events; callbacks (plain or
+        # coroutine functions) then run on the loop instead of inside the OS input hook.
+        # The queue is unbounded by default so no event is lost; a positive queue_maxsize caps
+        # it, and events arriving while it is full are dropped and counted in dropped_events
+        self._loop = loop
+        self._queue: Optional[asyncio.Queue] = asyncio.Queue(maxsize=queue_maxsize) if loop else None
+        self.dropped_events = 0
+        self._consumer = None
+        # Handler tasks started by the consumer; the loop only holds tasks weakly
+        self._tasks: set = set()
+        # On Windows, service mouse and keyboard from one native hook thread instead of
+        # pynput's two listener threads; pynput stays the fallback everywhere else
+        self.unified_hook = unified_hook
+        self._hook = None
 
         self._mouse_listener = None
         self._keyboard_listener = None
         self._available = False
+        # Last pointer position reported by the mouse listener; None while it is not running
+        self._pos: Optional[Tuple[int, int]] = None
+        # Ring buffer of recent move events as parallel arrays, for velocity/gesture code
+        self._xs = np.zeros(POSITION_HISTORY, dtype=np.float64)
+        self._ys = np.zeros(POSITION_HISTORY, dtype=np.float64)
+        self._ts = np.zeros(POSITION_HISTORY, dtype=np.int64)
+        self._head = 0
+        # Created on the first position query; False once creating it has failed
+        self._mouse_controller = None
 
-        try:
-            from pynput import mouse, keyboard
+        # Nothing to listen for: skip importing and initialising pynput altogether
+        if not any((on_click, on_scroll, on_press, on_key)):
+            return
 
+        pynput = _load_pynput()
+        if pynput is not None:
+            mouse, keyboard = pynput
             self._mouse_cls = mouse.Listener
             self._keyboard_cls = keyboard.Listener
-            self._mouse_controller = mouse.Controller()
             self._available = True
-        except ImportError:
-            logger.warning("pynput not found. Input monitoring disabled.")
-            self._available = False
-        except Exception as e:
-            logger.warning(f"Failed to initialize input libraries: {e}")
-            self._available = False
 
     def start(self):
         if not self._available:
             return
 
         try:
+            if self._loop is not None:
+                self._consumer = asyncio.run_coroutine_threadsafe(self._consume(), self._loop)
+
+            if self.unified_hook and sys.platform == "win32" and self._start_unified_hook():
+                logger.info("Input listeners started (unified hook)")
+                return
+
             if self.on_click or self.on_scroll:
+                # Seed the cached position; the listener keeps it current from then on
+                self._pos = self._query_mouse_position()
                 self._mouse_listener = self._mouse_cls(
-                    on_click=self.on_click, on_scroll=self.on_scroll, suppress=self.suppress
+                    on_move=self._on_move,
+                    on_click=self._dispatch(self.on_click),
+                    on_scroll=self._dispatch(self._downsample(self.on_scroll)),
+                    suppress=self.suppress,
                 )
                 self._mouse_listener.start()
 
-            if self.on_press:
+            if self.on_press or self.on_key:
+                on_press, on_release = self._key_callbacks()
                 self._keyboard_listener = self._keyboard_cls(
-                    on_press=self.on_press, suppress=self.suppress
+                    on_press=on_press, on_release=on_release, suppress=self.suppress
                 )
                 self._keyboard_listener.start()
 
@@ -62,18 +135,167 @@ class InputListener:
             logger.error(f"Failed to start input listeners: {e}")
             self.stop()
 
+    def _start_unified_hook(self) -> bool:
+        try:
+            from ..platform.windows.input_hook import WindowsInputHook
+
+            if self.on_click or self.on_scroll:
+                self._pos = self._query_mouse_position()
+            on_press, on_release = self._key_callbacks()
+            self._hook = WindowsInputHook(
+                on_move=self._on_move if (self.on_click or self.on_scroll) else None,
+                on_click=self._dispatch(self.on_click),
+                on_scroll=self._dispatch(self._downsample(self.on_scroll)),
+                on_press=on_press,
+                on_release=on_release,
+                suppress=self.suppress,
+            )
+            self._hook.start()
+            return True
+        except Exception as e:
+            logger.warning(f"Unified input hook unavailable, falling back to pynput: {e}")
+            self._hook = None
+            return False
+
     def stop(self):
+        if self._hook:
+            self._hook.stop()
+            self._hook = None
+
         if self._mouse_listener:
             self._mouse_listener.stop()
             self._mouse_listener = None
+        self._pos = None
 
         if self._keyboard_listener:
             self._keyboard_listener.stop()
             self._keyboard_listener = None
 
+        if self._consumer:
+            self._consumer.cancel()
+            self._consumer = None
+            if not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._cancel_tasks)
+
+    def _key_callbacks(self) -> Tuple[Optional[Callable], Optional[Callable]]:
+        """Build the keyboard listener's (on_press, on_release) from on_press and on_key."""
+        press = self._dispatch(self.on_press)
+        key = self._dispatch(self.on_key)
+        if key is None:
+            return press, None
+
+        def on_press(k):
+            if press:
+                press(k)
+            key(k, True)
+
+        def on_release(k):
+            key(k, False)
+
+        return on_press, on_release
+
+    def _dispatch(self, callback: Optional[Callable]) -> Optional[Callable]:
+        """Wrap a callback so the hook thread only hands the event to the loop."""
+        if callback is None or self._loop is None:
+            return callback
+
+        loop = self._loop
+
+        def enqueue(*args):
+            loop.call_soon_threadsafe(self._put_event, callback, args)
+
+        return enqueue
+
+    def _put_event(self, callback: Callable, args: tuple):
+        try:
+            self._queue.put_nowait((callback, args))
+        except asyncio.QueueFull:
+            self.dropped_events += 1
+            logger.warning(
+                f"Input event queue full ({self._queue.maxsize}), dropped {self.dropped_events} event(s) so far"
+            )
+
+    async def _consume(self):
+        """Run queued callbacks on the loop; coroutine handlers become tasks so one slow
+        handler does not hold up the events behind it."""
+        while True:
+            callback, args = await self._queue.get()
+            try:
+                result = callback(*args)
+                if asyncio.iscoroutine(result):
+                    task = asyncio.create_task(result)
+                    self._tasks.add(task)
+                    task.add_done_callback(self._task_done)
+            except Exception as e:
+                logger.error(f"Input callback failed: {e}")
+
+    def _task_done(self, task: asyncio.Task):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Input callback failed: %s", task.exception(), exc_info=task.exception())
+
+    def _cancel_tasks(self):
+        for task in list(self._tasks):
+            task.cancel()
+
+    def _downsample(self, callback: Optional[Callable]) -> Optional[Callable]:
+        """Wrap a motion callback so dropped events return before reaching it."""
+        every_n = max(1, self.motion_downsample_n)
+        min_dt_ns = int(self.motion_min_dt * 1_000_000_000)
+        if callback is None or (every_n == 1 and min_dt_ns <= 0):
+            return callback
+
+        counter = 0
+        last_ns = None
+
+        def downsampled(*args):
+            nonlocal counter, last_ns
+            counter += 1
+            if counter % every_n:
+                return None
+            now = time.monotonic_ns()
+            if last_ns is not None and now - last_ns < min_dt_ns:
+                return None
+            last_ns = now
+            return callback(*args)
+
+        return downsampled
+
+    def _on_move(self, x, y):
+        self._pos = (x, y)
+        i = self._head & (POSITION_HISTORY - 1)
+        self._xs[i] = x
+        self._ys[i] = y
+        self._ts[i] = time.monotonic_ns()
+        self._head += 1
+
+    def get_recent_positions(self, n: int = POSITION_HISTORY) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return up to the last n pointer samples as (xs, ys, monotonic_ns) arrays, oldest first."""
+        head = self._head
+        count = max(0, min(n, head, POSITION_HISTORY))
+        end = head & (POSITION_HISTORY - 1)
+        start = (head - count) & (POSITION_HISTORY - 1)
+        if start < end or count == 0:
+            return self._xs[start:end].copy(), self._ys[start:end].copy(), self._ts[start:end].copy()
+        return tuple(np.concatenate((a[start:], a[:end])) for a in (self._xs, self._ys, self._ts))
+
     def get_mouse_position(self) -> Tuple[int, int]:
-        """Get current mouse position."""
-        if self._available and self._mouse_controller:
+        """Get current mouse position, from the listener's cache while it is running."""
+        pos = self._pos
+        if pos is not None:
+            return pos
+        return self._query_mouse_position()
+
+    def _query_mouse_position(self) -> Tuple[int, int]:
+        """Ask the OS for the mouse position."""
+        if self._mouse_controller is None:
+            pynput = _load_pynput()
+            try:
+                self._mouse_controller = pynput[0].Controller() if pynput else False
+            except Exception as e:
+                logger.debug(f"Mouse position unavailable: {e}")
+                self._mouse_controller = False
+        if self._mouse_controller:
             try:
                 return self._mouse_controller.position
             except Exception:
@@ -848,24 +848,15 @@ class Screen(Observer):
                 await flush()
 
             # ---- Now that all event handlers are defined, set up the input listener ----
-            def schedule_event(x: float, y: float, typ: str):
-                # Non-blocking: just schedule the coroutine, don't wait for result
-                asyncio.run_coroutine_threadsafe(mouse_event(x, y, typ), loop)
-
-            def schedule_scroll_event(x: float, y: float, dx: float, dy: float):
-                # Non-blocking: just schedule the coroutine, don't wait for result
-                asyncio.run_coroutine_threadsafe(scroll_event(x, y, dx, dy), loop)
-
-            def schedule_key_event(key, typ: str):
-                # Non-blocking: just schedule the coroutine, don't wait for result
-                asyncio.run_coroutine_threadsafe(key_event(key, typ), loop)
-
+            # The listener queues events onto this loop, so the OS hook threads never
+            # wait on the handlers below
             input_listener = InputListener(
                 on_click=lambda x, y, btn, prs: (
-                    schedule_event(x, y, f"click_{btn.name}") if prs else None
+                    mouse_event(x, y, f"click_{btn.name}") if prs else None
                 ),
-                on_scroll=lambda x, y, dx, dy: schedule_scroll_event(x, y, dx, dy),
-                on_press=lambda key: schedule_key_event(key, "press"),
+                on_scroll=scroll_event,
+                on_press=lambda key: key_event(key, "press"),
+                loop=loop,
             )
             input_listener.start()
 
@@ -60,6 +60,13 @@ class ClipboardBase(ABC):
     def get_text(self) -> Optional[str]:
         """Get current clipboard text content; returns None when unsupported/unavailable."""
 
+    def get_change_count(self) -> Optional[int]:
+        """
+        Get a counter that changes whenever the clipboard contents change, so callers can skip
+        get_text() while it is unchanged. Optional - returns None if not supported.
+        """
+        return None
+
 
 class ActiveAppDetectorBase(ABC):
     """Abstract interface for detecting active application."""
@@ -80,6 +87,13 @@ class ActiveAppDetectorBase(ABC):
     def get_browser_tab_url(self, browser_name: str) -> Optional[str]:
         """Best-effort active tab URL; return None when unsupported."""
 
+    def get_browser_tab_info(self, browser_name: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Best-effort (title, url) of the active tab. Platforms where each lookup is a round-trip
+        to the browser can override this to fetch both at once.
+        """
+        return self.get_browser_tab_title(browser_name), self.get_browser_tab_url(browser_name)
+
 
 class RegionSelectorBase(ABC):
     """Abstract interface for interactive region selection."""
@@ -1,6 +1,6 @@
 import subprocess
 from AppKit import NSWorkspace
-from typing import Optional
+from typing import Optional, Tuple
 from ..base import ActiveAppDetectorBase
 
 
@@ -52,6 +52,40 @@ class MacOSActiveAppDetector(ActiveAppDetectorBase):
         except Exception:
             return None
 
+    def get_browser_tab_info(self, browser_name: str) -> Tuple[Optional[str], Optional[str]]:
+        """Get active tab title and URL from browser with a single AppleScript call."""
+        # Chromium browsers expose "active tab" with a "title"; Safari and Firefox a "current tab" with a "name"
+        tab_specs = {
+            "Google Chrome": ("active tab", "title"),
+            "Safari": ("current tab", "name"),
+            "Brave Browser": ("active tab", "title"),
+            "Firefox": ("current tab", "name"),
+            "Microsoft Edge": ("active tab", "title"),
+        }
+
+        spec = tab_specs.get(browser_name)
+        if not spec:
+            return None, None
+
+        tab, title = spec
+        script = (
+            f'tell application "{browser_name}"\n'
+            f"set t to {tab} of front window\n"
+            f"return ({title} of t) & linefeed & (URL of t)\n"
+            "end tell"
+        )
+        try:
+            result = subprocess.run(
+                ["osascript", "-e", script], capture_output=True, text=True, timeout=1
+            )
+            if result.returncode != 0:
+                return None, None
+            # Titles and URLs cannot contain line breaks, so the last one separates them
+            tab_title, _, url = result.stdout.rstrip("\n").rpartition("\n")
+            return tab_title.strip(), url.strip()
+        except Exception:
+            return None, None
+
     def get_browser_tab_url(self, browser_name: str) -> Optional[str]:
         """Get active tab URL from browser using AppleScript."""
         scripts = {
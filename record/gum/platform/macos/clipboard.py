@@ -12,3 +12,10 @@ class MacOSClipboard(ClipboardBase):
             return pasteboard.stringForType_("public.utf8-plain-text")
         except Exception:
             return None
+
+    def get_change_count(self) -> Optional[int]:
+        """Get the pasteboard change count, which increments on every copy."""
+        try:
+            return NSPasteboard.generalPasteboard().changeCount()
+        except Exception:
+            return None
@@ -30,3 +30,13 @@ class WindowsClipboard(ClipboardBase):
             except Exception:
                 pass
             return None
+
+    def get_change_count(self) -> Optional[int]:
+        """Get the clipboard sequence number, which changes on every clipboard update."""
+        if not WIN_CLIP_AVAILABLE:
+            return None
+        try:
+            return win32clipboard.GetClipboardSequenceNumber()
+        except Exception as e:
+            logger.debug("Clipboard sequence number unavailable: %s", e)
+            return None
@@ -0,0 +1,244 @@
+import ctypes
+import logging
+import threading
+from ctypes import wintypes
+from typing import Callable, Optional
+
+from pynput import keyboard, mouse
+
+logger = logging.getLogger(__name__)
+
+WH_KEYBOARD_LL = 13
+WH_MOUSE_LL = 14
+WM_QUIT = 0x0012
+WM_KEYDOWN = 0x0100
+WM_KEYUP = 0x0101
+WM_SYSKEYDOWN = 0x0104
+WM_SYSKEYUP = 0x0105
+WM_MOUSEMOVE = 0x0200
+WM_MOUSEWHEEL = 0x020A
+WM_MOUSEHWHEEL = 0x020E
+WHEEL_DELTA = 120
+VK_SHIFT = 0x10
+VK_CONTROL = 0x11
+VK_MENU = 0x12
+VK_CAPITAL = 0x14
+# Left/right variants are kept in sync with the generic codes so AltGr (Ctrl+Alt) translates
+_MODIFIER_VKS = (VK_SHIFT, VK_CONTROL, VK_MENU, 0xA0, 0xA1, 0xA2, 0xA3, 0xA4, 0xA5)
+# ToUnicodeEx flag (Windows 10 1607+): translate without changing the keyboard state, so
+# probing a dead key here does not swallow the accent the user is typing
+TOUNICODE_NO_STATE_CHANGE = 0x4
+
+# Button messages -> (button, pressed)
+_BUTTON_MESSAGES = {
+    0x0201: (mouse.Button.left, True),
+    0x0202: (mouse.Button.left, False),
+    0x0204: (mouse.Button.right, True),
+    0x0205: (mouse.Button.right, False),
+    0x0207: (mouse.Button.middle, True),
+    0x0208: (mouse.Button.middle, False),
+}
+
+# Virtual key code -> pynput Key for the named keys
+_SPECIAL_KEYS = {key.value.vk: key for key in keyboard.Key if key.value.vk is not None}
+
+LRESULT = ctypes.c_ssize_t
+HOOKPROC = ctypes.WINFUNCTYPE(LRESULT, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+
+
+class MSLLHOOKSTRUCT(ctypes.Structure):
+    _fields_ = [
+        ("pt", wintypes.POINT),
+        ("mouseData", wintypes.DWORD),
+        ("flags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class KBDLLHOOKSTRUCT(ctypes.Structure):
+    _fields_ = [
+        ("vkCode", wintypes.DWORD),
+        ("scanCode", wintypes.DWORD),
+        ("flags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+user32 = ctypes.WinDLL("user32", use_last_error=True)
+kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+user32.SetWindowsHookExW.argtypes = (ctypes.c_int, HOOKPROC, wintypes.HINSTANCE, wintypes.DWORD)
+user32.SetWindowsHookExW.restype = wintypes.HHOOK
+user32.CallNextHookEx.argtypes = (wintypes.HHOOK, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+user32.CallNextHookEx.restype = LRESULT
+user32.UnhookWindowsHookEx.argtypes = (wintypes.HHOOK,)
+user32.GetMessageW.argtypes = (ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT)
+user32.PostThreadMessageW.argtypes = (wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+user32.GetAsyncKeyState.argtypes = (ctypes.c_int,)
+user32.GetAsyncKeyState.restype = wintypes.SHORT
+user32.GetKeyState.argtypes = (ctypes.c_int,)
+user32.GetKeyState.restype = wintypes.SHORT
+user32.GetForegroundWindow.restype = wintypes.HWND
+user32.GetWindowThreadProcessId.argtypes = (wintypes.HWND, ctypes.POINTER(wintypes.DWORD))
+user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+user32.GetKeyboardLayout.argtypes = (wintypes.DWORD,)
+user32.GetKeyboardLayout.restype = wintypes.HKL
+user32.ToUnicodeEx.argtypes = (
+    wintypes.UINT,
+    wintypes.UINT,
+    ctypes.POINTER(ctypes.c_ubyte),
+    wintypes.LPWSTR,
+    ctypes.c_int,
+    wintypes.UINT,
+    wintypes.HKL,
+)
+user32.ToUnicodeEx.restype = ctypes.c_int
+kernel32.GetModuleHandleW.argtypes = (wintypes.LPCWSTR,)
+kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+kernel32.GetCurrentThreadId.restype = wintypes.DWORD
+
+
+class WindowsInputHook:
+    """
+    Low-level mouse and keyboard hooks serviced by one shared message-loop thread.
+
+    Callbacks receive the same arguments as pynput's listeners, so it can stand in
+    for a pynput mouse.Listener and keyboard.Listener pair. Like pynput, key characters
+    are translated with ToUnicodeEx against the foreground window's keyboard layout and
+    the current Shift/Ctrl/Alt/Caps Lock state.
+    """
+
+    def __init__(
+        self,
+        on_move: Optional[Callable] = None,
+        on_click: Optional[Callable] = None,
+        on_scroll: Optional[Callable] = None,
+        on_press: Optional[Callable] = None,
+        on_release: Optional[Callable] = None,
+        suppress: bool = False,
+    ):
+        self.on_move = on_move
+        self.on_click = on_click
+        self.on_scroll = on_scroll
+        self.on_press = on_press
+        self.on_release = on_release
+        self.suppress = suppress
+
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id: Optional[int] = None
+        self._ready = threading.Event()
+        self._error: Optional[Exception] = None
+        # Keep references so the ctypes thunks outlive the hooks
+        self._mouse_proc = HOOKPROC(self._mouse_hook)
+        self._keyboard_proc = HOOKPROC(self._keyboard_hook)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="WindowsInputHook", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    def stop(self):
+        if self._thread is None:
+            return
+        user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+        self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def _run(self):
+        self._thread_id = kernel32.GetCurrentThreadId()
+        module = kernel32.GetModuleHandleW(None)
+        hooks = []
+        try:
+            if self.on_move or self.on_click or self.on_scroll:
+                hooks.append(self._install(WH_MOUSE_LL, self._mouse_proc, module))
+            if self.on_press or self.on_release:
+                hooks.append(self._install(WH_KEYBOARD_LL, self._keyboard_proc, module))
+        except OSError as e:
+            self._error = e
+        self._ready.set()
+
+        try:
+            if self._error is None:
+                msg = wintypes.MSG()
+                while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                    pass
+        finally:
+            for hook in hooks:
+                user32.UnhookWindowsHookEx(hook)
+
+    @staticmethod
+    def _install(hook_id: int, proc, module):
+        hook = user32.SetWindowsHookExW(hook_id, proc, module, 0)
+        if not hook:
+            raise ctypes.WinError(ctypes.get_last_error())
+        return hook
+
+    def _mouse_hook(self, n_code, w_param, l_param):
+        if n_code >= 0:
+            try:
+                info = ctypes.cast(l_param, ctypes.POINTER(MSLLHOOKSTRUCT)).contents
+                x, y = info.pt.x, info.pt.y
+                if w_param == WM_MOUSEMOVE:
+                    if self.on_move:
+                        self.on_move(x, y)
+                elif w_param in _BUTTON_MESSAGES:
+                    if self.on_click:
+                        button, pressed = _BUTTON_MESSAGES[w_param]
+                        self.on_click(x, y, button, pressed)
+                elif w_param in (WM_MOUSEWHEEL, WM_MOUSEHWHEEL):
+                    if self.on_scroll:
+                        delta = ctypes.c_short(info.mouseData >> 16).value // WHEEL_DELTA
+                        if w_param == WM_MOUSEWHEEL:
+                            self.on_scroll(x, y, 0, delta)
+                        else:
+                            self.on_scroll(x, y, delta, 0)
+            except Exception as e:
+                logger.debug("Mouse hook callback failed: %s", e)
+            if self.suppress:
+                return 1
+        return user32.CallNextHookEx(None, n_code, w_param, l_param)
+
+    def _keyboard_hook(self, n_code, w_param, l_param):
+        if n_code >= 0:
+            if w_param in (WM_KEYDOWN, WM_SYSKEYDOWN):
+                callback = self.on_press
+            elif w_param in (WM_KEYUP, WM_SYSKEYUP):
+                callback = self.on_release
+            else:
+                callback = None
+            if callback:
+                try:
+                    info = ctypes.cast(l_param, ctypes.POINTER(KBDLLHOOKSTRUCT)).contents
+                    callback(self._key_for(info.vkCode, info.scanCode))
+                except Exception as e:
+                    logger.debug("Keyboard hook callback failed: %s", e)
+            if self.suppress:
+                return 1
+        return user32.CallNextHookEx(None, n_code, w_param, l_param)
+
+    @staticmethod
+    def _key_for(vk: int, scan: int):
+        key = _SPECIAL_KEYS.get(vk)
+        if key is not None:
+            return key
+
+        # The hook thread's own keyboard state is not updated by other apps' input, so
+        # modifiers are read from the global async state and Caps Lock from its toggle bit
+        state = (ctypes.c_ubyte * 256)()
+        for modifier in _MODIFIER_VKS:
+            if user32.GetAsyncKeyState(modifier) & 0x8000:
+                state[modifier] = 0x80
+        state[VK_CAPITAL] = user32.GetKeyState(VK_CAPITAL) & 0x01
+
+        thread_id = user32.GetWindowThreadProcessId(user32.GetForegroundWindow(), None)
+        layout = user32.GetKeyboardLayout(thread_id)
+        buf = ctypes.create_unicode_buffer(8)
+        count = user32.ToUnicodeEx(vk, scan, state, buf, len(buf), TOUNICODE_NO_STATE_CHANGE, layout)
+        if count < 0:
+            # Dead key: the accent combines with the next key press
+            return keyboard.KeyCode(vk=vk, char=buf.value[:1] or None, is_dead=True)
+        return keyboard.KeyCode(vk=vk, char=buf.value[:count] if count > 0 else None)
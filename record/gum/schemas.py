@@ -39,6 +39,10 @@ class Update(BaseModel):
     content_type: str = Field(..., description="The type of the update")
 
 
+class UpdateBatch(BaseModel):
+    updates: List[Update] = Field(..., description="Updates emitted together, stored in one transaction")
+
+
 RelationLabel = Literal["IDENTICAL", "SIMILAR", "UNRELATED"]
 
 
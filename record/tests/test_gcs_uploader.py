@@ -0,0 +1,113 @@
+"""
+Tests for the GCS bundle uploader.
+"""
+
+import io
+import sys
+import tarfile
+
+import pytest
+
+
+class TestLargeChunkReader:
+    """Tests for the upload body wrapper."""
+
+    def test_len_reports_size(self):
+        """__len__ should report the given size so requests sends Content-Length."""
+        from gum.gcs_uploader import _LargeChunkReader
+
+        assert len(_LargeChunkReader(io.BytesIO(b"abc"), 3)) == 3
+
+    def test_read_returns_up_to_chunk_size_whatever_is_requested(self):
+        """read() should return up to UPLOAD_CHUNK_SIZE bytes whatever size the caller asks for."""
+        from gum.gcs_uploader import UPLOAD_CHUNK_SIZE, _LargeChunkReader
+
+        data = bytes(range(256)) * (3 * UPLOAD_CHUNK_SIZE // 256) + b"tail"
+        reader = _LargeChunkReader(io.BytesIO(data), len(data))
+
+        # A small block size (as http.client asks for), a huge one, and the default
+        chunks = [reader.read(8192), reader.read(10 * UPLOAD_CHUNK_SIZE), reader.read(), reader.read(1)]
+        assert [len(c) for c in chunks] == [UPLOAD_CHUNK_SIZE] * 3 + [len(b"tail")]
+        assert b"".join(chunks) == data
+        assert reader.read(8192) == b""
+
+
+class TestWriteTarball:
+    """Tests for bundle tarball creation."""
+
+    @pytest.fixture
+    def members(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.txt").write_text("alpha")
+        (src / "skip.tmp").write_text("skipped")
+        return [(src / "a.txt", "bundle/a.txt"), (src / "skip.tmp", "bundle/skip.tmp")]
+
+    def _names(self, path):
+        with tarfile.open(path, "r:gz") as tar:
+            return {m.name: tar.extractfile(m).read() for m in tar.getmembers()}
+
+    def _filter(self, tarinfo):
+        return None if tarinfo.name.endswith(".tmp") else tarinfo
+
+    def test_tarfile_fallback(self, tmp_path, members, monkeypatch):
+        """Without pigz the bundle should be written by tarfile, applying the filter."""
+        from gum import gcs_uploader
+
+        monkeypatch.setattr(gcs_uploader.shutil, "which", lambda name: None)
+        out = tmp_path / "bundle.tar.gz"
+        gcs_uploader.GCSUploader(str(tmp_path / "missing.json"))._write_tarball(out, members, filter=self._filter)
+
+        assert self._names(out) == {"bundle/a.txt": b"alpha"}
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Uses a shell script as a stand-in for pigz")
+    def test_pigz_pipe(self, tmp_path, members, monkeypatch):
+        """With pigz the uncompressed tar stream should be piped through it."""
+        from gum import gcs_uploader
+
+        fake_pigz = tmp_path / "pigz"
+        fake_pigz.write_text("#!/bin/sh\nexec gzip -c\n")
+        fake_pigz.chmod(0o755)
+        monkeypatch.setattr(gcs_uploader.shutil, "which", lambda name: str(fake_pigz))
+        out = tmp_path / "bundle.tar.gz"
+        gcs_uploader.GCSUploader(str(tmp_path / "missing.json"))._write_tarball(out, members, filter=self._filter)
+
+        assert self._names(out) == {"bundle/a.txt": b"alpha"}
+
+
+class TestUpload:
+    """Tests for the pre-signed URL upload order."""
+
+    @pytest.fixture
+    def uploader(self, tmp_path):
+        from gum.gcs_uploader import GCSUploader
+
+        uploader = GCSUploader(str(tmp_path / "missing.json"))
+        uploader.enabled = True
+        uploader.config = {"session_urls": [{"slot": 0, "tarball_url": "tar-url", "metadata_url": "meta-url"}]}
+        uploader._session_slot = 0
+        return uploader
+
+    def test_metadata_uploaded_after_tarball(self, uploader, tmp_path, monkeypatch):
+        """The metadata PUT should only start once the tarball PUT has finished."""
+        calls = []
+        monkeypatch.setattr(uploader, "_put", lambda url, *args: calls.append(url))
+
+        assert uploader.upload(tmp_path / "b.tar.gz", tmp_path / "b.json")["status"] == "success"
+        assert calls == ["tar-url", "meta-url"]
+
+    def test_failed_tarball_skips_metadata(self, uploader, tmp_path, monkeypatch):
+        """A failed tarball upload should not leave metadata for a missing bundle."""
+        import requests
+
+        calls = []
+
+        def put(url, *args):
+            calls.append(url)
+            if url == "tar-url":
+                raise requests.exceptions.ConnectionError()
+
+        monkeypatch.setattr(uploader, "_put", put)
+
+        assert uploader.upload(tmp_path / "b.tar.gz", tmp_path / "b.json")["status"] == "error"
+        assert calls == ["tar-url"]
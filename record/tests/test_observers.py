@@ -50,6 +50,143 @@ class TestInputListener:
         assert isinstance(pos, tuple)
         assert len(pos) == 2
 
+    def test_get_mouse_position_uses_listener_moves(self):
+        """get_mouse_position should return the last position reported by the mouse listener."""
+        from gum.observers.input import InputListener
+
+        listener = InputListener()
+        listener._on_move(120, 45)
+
+        assert listener.get_mouse_position() == (120, 45)
+
+        listener.stop()
+        assert listener._pos is None
+
+    def test_get_recent_positions_wraps_in_order(self):
+        """get_recent_positions should return the newest samples oldest first across the ring boundary."""
+        from gum.observers.input import InputListener, POSITION_HISTORY
+
+        listener = InputListener()
+        assert len(listener.get_recent_positions(10)[0]) == 0
+
+        for i in range(POSITION_HISTORY + 5):
+            listener._on_move(i, -i)
+
+        xs, ys, ts = listener.get_recent_positions(8)
+        assert xs.tolist() == list(range(POSITION_HISTORY - 3, POSITION_HISTORY + 5))
+        assert ys.tolist() == [-x for x in xs.tolist()]
+        assert (ts[1:] >= ts[:-1]).all()
+        assert len(listener.get_recent_positions()[0]) == POSITION_HISTORY
+
+    def test_on_key_receives_both_transitions(self):
+        """on_key should be called with pressed=True and False from one press/release pair."""
+        from gum.observers.input import InputListener
+
+        on_key = MagicMock()
+        on_press, on_release = InputListener(on_key=on_key)._key_callbacks()
+        on_press("a")
+        on_release("a")
+
+        assert [c.args for c in on_key.call_args_list] == [("a", True), ("a", False)]
+
+    def test_scroll_downsampling(self):
+        """Only every motion_downsample_n-th scroll event should reach on_scroll."""
+        from gum.observers.input import InputListener
+
+        on_scroll = MagicMock()
+        listener = InputListener(on_scroll=on_scroll, motion_downsample_n=3)
+        downsampled = listener._downsample(on_scroll)
+
+        for i in range(7):
+            downsampled(i, 0, 0, 1)
+
+        assert [c.args[0] for c in on_scroll.call_args_list] == [2, 5]
+        # Without downsampling the callback is passed through unchanged
+        assert InputListener(on_scroll=on_scroll)._downsample(on_scroll) is on_scroll
+
+    def test_callbacks_run_on_loop(self):
+        """With a loop, hook-thread events should be handed to the loop and run there."""
+        import asyncio
+        import threading
+
+        from gum.observers.input import InputListener
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            seen = []
+            done = asyncio.Event()
+
+            async def on_press(key):
+                seen.append((key, threading.current_thread() is threading.main_thread()))
+                done.set()
+
+            listener = InputListener(on_press=on_press, loop=loop)
+            consumer = asyncio.create_task(listener._consume())
+            hook = threading.Thread(target=listener._dispatch(on_press), args=("a",))
+            hook.start()
+            hook.join()
+            await asyncio.wait_for(done.wait(), 1)
+            consumer.cancel()
+            return seen
+
+        assert asyncio.run(scenario()) == [("a", True)]
+
+    def test_full_event_queue_drops_and_counts(self, caplog):
+        """A bounded queue should drop overflow events with a warning; the default never drops."""
+        import asyncio
+
+        from gum.observers.input import InputListener
+
+        loop = asyncio.new_event_loop()
+        try:
+            on_press = MagicMock()
+            bounded = InputListener(on_press=on_press, loop=loop, queue_maxsize=2)
+            with caplog.at_level("WARNING", logger="InputObserver"):
+                for key in "abc":
+                    bounded._put_event(on_press, (key,))
+
+            assert bounded._queue.qsize() == 2
+            assert bounded.dropped_events == 1
+            assert "dropped 1 event(s)" in caplog.text
+
+            unbounded = InputListener(on_press=on_press, loop=loop)
+            for key in "abcdef":
+                unbounded._put_event(on_press, (key,))
+            assert unbounded._queue.qsize() == 6
+            assert unbounded.dropped_events == 0
+        finally:
+            loop.close()
+
+    def test_handler_tasks_are_tracked_and_cancelled_on_stop(self):
+        """Coroutine handlers should be held until done and cancelled by stop()."""
+        import asyncio
+
+        from gum.observers.input import InputListener
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            started = asyncio.Event()
+
+            async def on_press(key):
+                started.set()
+                await asyncio.sleep(10)
+
+            listener = InputListener(on_press=on_press, loop=loop)
+            listener._consumer = asyncio.run_coroutine_threadsafe(listener._consume(), loop)
+            listener._dispatch(on_press)("a")
+            await asyncio.wait_for(started.wait(), 1)
+            assert len(listener._tasks) == 1
+            (task,) = listener._tasks
+
+            listener.stop()
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            return task, listener._tasks
+
+        task, remaining = asyncio.run(scenario())
+        assert task.cancelled()
+        assert not remaining
+
 
 class TestAIActivityDetector:
     """Tests for AIActivityDetector with mocked platform."""
@@ -102,6 +239,138 @@ class TestAIActivityDetector:
         assert isinstance(observer.BROWSERS, list)
         assert "Google Chrome" in observer.BROWSERS
 
+    def test_clipboard_read_failure_is_retried(self, mock_platform, tmp_path):
+        """A failed clipboard read should not consume the change count; the next poll retries it."""
+        import asyncio
+        import logging
+
+        from gum.observers.ai_activity import AIActivityDetector
+
+        clipboard = mock_platform["clipboard"]
+        clipboard.get_change_count.return_value = 7
+        # The copying app still holds the clipboard on the first read
+        clipboard.get_text.side_effect = [None, "copied answer"]
+
+        async def scenario():
+            observer = AIActivityDetector(data_directory=str(tmp_path))
+            observer._current_ai_tool = "ChatGPT"
+            log = logging.getLogger("test")
+            await observer._check_clipboard(log)
+            missed = list(observer._pending)
+            await observer._check_clipboard(log)
+            await observer.stop()
+            return missed, observer._pending, observer._last_clipboard_change
+
+        missed, pending, change = asyncio.run(scenario())
+        assert missed == []
+        assert [u.content_type for u in pending] == ["ai_clipboard"]
+        assert "copied answer" in pending[0].content
+        assert change == 7
+        assert clipboard.get_text.call_count == 2
+
+    def test_flush_pending_sends_single_update_or_batch(self, mock_platform, tmp_path):
+        """One pending update should be queued as-is; several should be queued as one UpdateBatch."""
+        import asyncio
+
+        from gum.observers.ai_activity import AIActivityDetector
+        from gum.schemas import Update, UpdateBatch
+
+        async def scenario():
+            observer = AIActivityDetector(data_directory=str(tmp_path))
+            single = Update(content="one", content_type="ai_activity")
+            observer._pending.append(single)
+            await observer._flush_pending()
+            first = observer.update_queue.get_nowait()
+
+            batch = [Update(content=str(i), content_type="ai_activity") for i in range(3)]
+            observer._pending.extend(batch)
+            await observer._flush_pending()
+            second = observer.update_queue.get_nowait()
+            empty = observer.update_queue.empty() and not observer._pending
+            await observer.stop()
+            return single, first, batch, second, empty
+
+        single, first, batch, second, empty = asyncio.run(scenario())
+        assert first is single
+        assert isinstance(second, UpdateBatch)
+        assert second.updates == batch
+        assert empty
+
+
+class TestDefaultHandler:
+    """Tests for storing observer updates."""
+
+    def _handler_self(self, audited=()):
+        import logging
+        from contextlib import asynccontextmanager
+        from types import SimpleNamespace
+
+        sessions = []
+
+        class FakeSession:
+            def __init__(self):
+                self.added = []
+                self.flushes = 0
+
+            def add(self, obj):
+                self.added.append(obj)
+
+            async def flush(self):
+                self.flushes += 1
+
+        @asynccontextmanager
+        async def session():
+            s = FakeSession()
+            sessions.append(s)
+            yield s
+
+        async def handle_audit(obs):
+            return obs.content in audited
+
+        fake = SimpleNamespace(logger=logging.getLogger("test"), _session=session, _handle_audit=handle_audit)
+        return fake, sessions
+
+    def _run(self, fake, update):
+        import asyncio
+        from types import SimpleNamespace
+
+        from gum.gum import gum
+
+        observer = SimpleNamespace(name="AIActivityDetector")
+        asyncio.run(gum._default_handler(fake, observer, update))
+
+    def test_batch_is_stored_in_one_session(self):
+        """An UpdateBatch of N updates should become N Observation rows in a single session."""
+        from gum.schemas import Update, UpdateBatch
+
+        fake, sessions = self._handler_self()
+        self._run(fake, UpdateBatch(updates=[Update(content=str(i), content_type="ai_activity") for i in range(3)]))
+
+        assert len(sessions) == 1
+        assert [o.content for o in sessions[0].added] == ["0", "1", "2"]
+        assert {o.observer_name for o in sessions[0].added} == {"AIActivityDetector"}
+        assert sessions[0].flushes == 1
+
+    def test_single_update_is_stored(self):
+        """A plain Update should still be stored as one Observation."""
+        from gum.schemas import Update
+
+        fake, sessions = self._handler_self()
+        self._run(fake, Update(content="solo", content_type="ai_clipboard"))
+
+        assert len(sessions) == 1
+        assert [(o.content, o.content_type) for o in sessions[0].added] == [("solo", "ai_clipboard")]
+
+    def test_audited_observation_skipped_without_dropping_batch(self):
+        """An observation rejected by the audit should be skipped while the rest of the batch is stored."""
+        from gum.schemas import Update, UpdateBatch
+
+        fake, sessions = self._handler_self(audited={"secret"})
+        updates = [Update(content=c, content_type="ai_activity") for c in ("a", "secret", "b")]
+        self._run(fake, UpdateBatch(updates=updates))
+
+        assert [o.content for o in sessions[0].added] == ["a", "b"]
+
 
 class TestScreenObserver:
     """Tests for Screen observer with mocked dependencies."""
@@ -165,3 +434,118 @@ class TestScreenObserver:
         assert region["top"] == 100
         assert region["width"] == 400
         assert region["height"] == 300
+
+
+class TestConversationObserver:
+    """Tests for ConversationObserver's wakeup and check scheduling."""
+
+    def test_notify_from_another_thread_wakes_worker(self, tmp_path):
+        """notify() from a producer thread should run a check without waiting for the interval."""
+        import asyncio
+        import threading
+        from unittest.mock import AsyncMock
+
+        from gum.observers.conversation import ConversationObserver
+
+        async def scenario():
+            observer = ConversationObserver(data_directory=str(tmp_path), poll_interval=30.0)
+            observer._check_conversation = AsyncMock(return_value=False)
+            observer.add_source()
+            await asyncio.sleep(0)
+
+            producer = threading.Thread(target=observer.notify)
+            producer.start()
+            producer.join()
+            for _ in range(100):
+                if observer._check_conversation.await_count:
+                    break
+                await asyncio.sleep(0.01)
+
+            checks = observer._check_conversation.await_count
+            interval = observer._cur_interval
+            await observer.stop()
+            return checks, interval
+
+        checks, interval = asyncio.run(scenario())
+        assert checks == 1
+        # A wakeup with work halves the fallback interval
+        assert interval == 15.0
+
+    def test_stop_ends_waiting_worker(self, tmp_path):
+        """stop() should end a worker that is waiting out a long interval."""
+        import asyncio
+
+        from gum.observers.conversation import ConversationObserver
+
+        async def scenario():
+            observer = ConversationObserver(data_directory=str(tmp_path), poll_interval=30.0)
+            observer.add_source()
+            await asyncio.sleep(0)
+            await asyncio.wait_for(observer.stop(), 1)
+            return observer._task.done()
+
+        assert asyncio.run(scenario())
+
+    def test_adjust_interval_halves_on_work_and_backs_off_when_idle(self, tmp_path):
+        """The interval should shrink to the minimum with work and double after an idle streak."""
+        import asyncio
+
+        from gum.observers.conversation import ConversationObserver
+
+        async def scenario():
+            observer = ConversationObserver(
+                data_directory=str(tmp_path), poll_interval=1.0, min_poll_interval=0.25, max_poll_interval=4.0
+            )
+            intervals = []
+            for _ in range(3):
+                observer._adjust_interval(True)
+                intervals.append(observer._cur_interval)
+            for _ in range(observer.IDLE_STREAK_BEFORE_BACKOFF * 6):
+                observer._adjust_interval(False)
+                intervals.append(observer._cur_interval)
+            await observer.stop()
+            return intervals, observer.IDLE_STREAK_BEFORE_BACKOFF
+
+        intervals, streak = asyncio.run(scenario())
+        assert intervals[:3] == [0.5, 0.25, 0.25]
+        idle = intervals[3:]
+        # Unchanged until a full idle streak, then doubled, capped at the maximum
+        assert idle[streak - 2] == 0.25
+        assert idle[streak - 1] == 0.5
+        assert idle[2 * streak - 1] == 1.0
+        assert idle[-1] == 4.0
+
+    def test_parks_without_sources_until_one_is_added(self, tmp_path):
+        """Checks should only run while a source is registered, and stop() should end a parked worker."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from gum.observers.conversation import ConversationObserver
+
+        async def scenario():
+            observer = ConversationObserver(data_directory=str(tmp_path), poll_interval=0.01)
+            observer._check_conversation = AsyncMock(return_value=False)
+            observer.notify()
+            await asyncio.sleep(0.05)
+            parked_checks = observer._check_conversation.await_count
+
+            observer.add_source()
+            await asyncio.sleep(0.05)
+            active_checks = observer._check_conversation.await_count
+
+            observer.remove_source()
+            await asyncio.sleep(0.05)
+            settled = observer._check_conversation.await_count
+            await asyncio.sleep(0.05)
+            reparked_checks = observer._check_conversation.await_count - settled
+
+            await asyncio.wait_for(observer.stop(), 1)
+            with pytest.raises(ValueError):
+                observer.remove_source()
+            return parked_checks, active_checks, reparked_checks, observer._task.done()
+
+        parked_checks, active_checks, reparked_checks, done = asyncio.run(scenario())
+        assert parked_checks == 0
+        assert active_checks > 0
+        assert reparked_checks == 0
+        assert done